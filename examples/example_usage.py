@@ -21,7 +21,7 @@
     --------------------------
     - headless (bool): Whether to run the browser in headless mode (no GUI).
     - timeout (int): Maximum wait time (in seconds) for elements to load.
-    - max_refresh_attempts (int): Max page refreshes if profiles are not loading.
+    - max_reopen_attempts (int): Max modal reopens if profiles stop loading.
     - wait_interval (float): Time to wait between scroll checks.
     - additional_scroll_attempts (int): Extra scroll attempts to load more profiles.
     - pause_time (float): Pause between each scroll.
@@ -62,7 +62,7 @@ extractor = InstaExtractor(username=username, password=password, headless=headle
 try:
     # === CONFIGURATION ===
     # You can fine-tune the behavior of the extractor:
-    extractor.max_refresh_attempts = 10  # How many times to refresh if no new profiles are loaded
+    extractor.max_reopen_attempts = 3    # How many times to reopen the list if no new profiles are loaded
     extractor.wait_interval = 0.4        # Delay between checks for new profiles (in seconds)
     extractor.additional_scroll_attempts = 2  # Extra scrolls to ensure full list capture
     extractor.pause_time = 0.4           # Pause between each scroll (in seconds)
@@ -74,7 +74,7 @@ try:
     # Optional parameter `max_duration` sets a time limit (in seconds) for the scroll loop.
     # If this time is exceeded, scrolling will stop even if not all profiles are captured.
     # If `max_duration` is None (default), the extractor will continue until the expected count
-    # is reached or max_refresh_attempts is exceeded.
+    # is reached or max_reopen_attempts is exceeded.
     followers = extractor.get_followers("target_profile_username", max_duration=30.0)
     print(f"Followers found: {len(followers)}")
     print(followers)
@@ -7,6 +7,10 @@ Provides:
 - utils: helper functions for WebDriver operations
 """
 
+from ._logging import configure_logging
+
+configure_logging()
+
 from . import backoff, checkpoint, constants, session_cache, utils
 from .async_extractor import AsyncInstaExtractor  # last: depends on extractor + exporters
 from .backoff import SmartBackoff
@@ -66,4 +70,5 @@ __all__ = [
     "Profile",
     "ImapConfig",
     "fetch_instagram_code",
+    "configure_logging",
 ]
@@ -0,0 +1,64 @@
+"""
+Configuração única dos sinks Loguru do InstaT.
+
+extractor.py e login.py faziam `logger.remove()` + `logger.add(...)` no
+import: cada módulo apagava os sinks do outro e, dependendo da ordem de
+import, todo registro passava por dois arquivos. Agora o pacote configura
+uma vez em `instat/__init__.py`; chamadas repetidas são no-op.
+
+Nível do arquivo de log: INFO por default. Para DEBUG (loga cada round
+do scroll), defina INSTAT_LOG_LEVEL=DEBUG ou chame
+`configure_logging(file_level="DEBUG", force=True)`.
+"""
+import os
+import sys
+from typing import Optional
+
+from loguru import logger
+
+LOG_FILE = "instat/logs/insta_extractor.log"
+LOG_FORMAT = (
+    "<green>{time:YYYY-MM-DD HH:mm:ss.SSS}</green> | "
+    "<level>{level: <8}</level> | "
+    "<cyan>{name}</cyan>:<cyan>{function}</cyan>:<cyan>{line}</cyan> - "
+    "<level>{message}</level>"
+)
+
+_configured = False
+
+
+def configure_logging(file_level: Optional[str] = None, force: bool = False) -> None:
+    """Instala sink stderr (DEBUG) + arquivo rotativo (INFO por default).
+    Idempotente: só reconfigura com force=True."""
+    global _configured
+    if _configured and not force:
+        return
+    if file_level is None:
+        file_level = os.environ.get("INSTAT_LOG_LEVEL", "INFO")
+    file_level = file_level.strip().upper()
+    # Roda no `import instat`: um nível inválido não pode derrubar o import.
+    try:
+        logger.level(file_level)
+        invalid_level = None
+    except ValueError:
+        invalid_level, file_level = file_level, "INFO"
+
+    logger.remove()
+    logger.add(
+        sys.stderr,
+        level="DEBUG",
+        colorize=True,
+        backtrace=True,
+        diagnose=False,
+        format=LOG_FORMAT,
+    )
+    logger.add(
+        LOG_FILE, rotation="10 MB", retention="10 days",
+        level=file_level, backtrace=True, diagnose=False,
+    )
+    _configured = True
+    if invalid_level is not None:
+        logger.warning(f"Unknown log level {invalid_level!r} (INSTAT_LOG_LEVEL); using INFO.")
+
+
+__all__ = ["configure_logging"]
@@ -13,22 +13,27 @@ except ImportError:
 
 class SmartBackoff:
     """
-    Delays crescentes: base^0, base^1, base^2... até max_delay.
-    Jitter multiplica por uniform(0.5, 1.5) para evitar padrão detectável.
+    Delays crescentes: scale*base^0, scale*base^1... até max_delay.
+    Jitter multiplica por uniform(0.5, 1.5) para evitar padrão detectável;
+    o resultado nunca passa de max_delay.
     Reset após sucesso (novos perfis encontrados).
     """
 
-    def __init__(self, base: float = 2.0, max_delay: float = 300.0, jitter: bool = True):
+    def __init__(self, base: float = 2.0, max_delay: float = 300.0, jitter: bool = True,
+                 scale: float = 1.0):
         self.base = base
+        self.scale = scale
         self.max_delay = max_delay
         self.jitter = jitter
         self.attempt = 0
 
     def wait(self) -> float:
         """Calcula delay, aplica jitter, executa human_delay, incrementa attempt."""
-        delay = min(self.base ** self.attempt, self.max_delay)
+        delay = self.scale * self.base ** self.attempt
         if self.jitter:
             delay *= random.uniform(0.5, 1.5)
+        # Teto aplicado depois do jitter: max_delay é o máximo real.
+        delay = min(delay, self.max_delay)
         self.attempt += 1
         human_delay(delay, variance=delay * 0.2)
         return delay
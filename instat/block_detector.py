@@ -17,7 +17,9 @@ Design choices:
   - Rules are class-level data (URL_INDICATORS, HTML_SIGNATURES) so
     subclasses or instances can extend/override without monkey-patching.
   - No dependency on InstaLogin or any engine — only needs
-    `driver.current_url`, `driver.title`, `driver.page_source`.
+    `driver.current_url`, `driver.title`, `driver.execute_script`
+    (HTML probe) and `driver.page_source` (fallback when the probe
+    can't run).
 
 Extension guide:
   1. New URL pattern: add to URL_INDICATORS.
@@ -109,6 +111,16 @@ class BlockDetector:
     LOGIN_LOOP_REASON = "Credenciais inválidas ou login em loop"
     LOGIN_LOOP_ACTION = "Verifique username/password. A conta pode estar desativada."
 
+    # Runs the HTML_SIGNATURES scan inside the browser: returns the first
+    # signature contained in the lowercased document HTML, or null. Only
+    # the matched string crosses the wire — the clean-page case no longer
+    # ships the whole page_source to Python just to casefold it.
+    HTML_PROBE_JS = (
+        "const el = document.documentElement;"
+        "const h = el ? el.outerHTML.toLowerCase() : '';"
+        "return arguments[0].find(s => h.includes(s)) || null;"
+    )
+
     def check(self, driver: Any) -> Optional[BlockInfo]:
         """Return a BlockInfo if the driver is in a blocked state,
         else None. Never raises — a broken driver just returns None."""
@@ -171,12 +183,35 @@ class BlockDetector:
                 )
         return None
 
+    def _probe_html(self, driver: Any) -> Tuple[bool, Optional[str]]:
+        """(probe_ok, matched_signature) from HTML_PROBE_JS. probe_ok is
+        False when the script failed or returned something unexpected;
+        the caller then falls back to scanning page_source."""
+        try:
+            hit = driver.execute_script(
+                self.HTML_PROBE_JS, [sig for sig, _, _ in self.HTML_SIGNATURES]
+            )
+        except Exception:
+            return False, None
+        if hit is None or isinstance(hit, str):
+            return True, hit
+        return False, None
+
     def _check_html(self, url: str, driver: Any) -> Optional[BlockInfo]:
-        html = self._safe_page_source(driver)
-        if not html:
-            return None
+        probe_ok, hit = self._probe_html(driver)
+        if probe_ok:
+            if hit is None:
+                return None
+            matched = hit
+        else:
+            html = self._safe_page_source(driver)
+            if not html:
+                return None
+            matched = next(
+                (sig for sig, _, _ in self.HTML_SIGNATURES if sig in html), None
+            )
         for sig, reason, action in self.HTML_SIGNATURES:
-            if sig in html:
+            if sig == matched:
                 return BlockInfo(
                     reason=reason,
                     action=action,
@@ -3,7 +3,7 @@ Configuration loader for InstaT.
 
 Provides:
 - SelectorLoader: utility class to load CSS/XPath selectors from JSON
-- selectors: preloaded default selectors as dictionary
+- selectors: default selectors as dictionary (loaded on first access)
 """
 
 import os
@@ -12,12 +12,21 @@ from .selector_loader import SelectorLoader
 
 DEFAULT_SELECTORS_PATH = os.path.join(os.path.dirname(__file__), "selectors.json")
 
-# Safe loader with fallback
-try:
-    selectors = SelectorLoader(DEFAULT_SELECTORS_PATH).selectors
-except Exception as e:
-    import logging
-    logging.warning(f"Could not load selectors.json: {e}. Using empty fallback.")
-    selectors = {}
+
+def __getattr__(name):
+    # `selectors` é carregado no primeiro acesso (PEP 562), não no import
+    # do pacote: todo `import instat.config.selector_loader` passa por aqui.
+    if name != "selectors":
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    global selectors
+    # Safe loader with fallback
+    try:
+        selectors = SelectorLoader(DEFAULT_SELECTORS_PATH).selectors
+    except Exception as e:
+        import logging
+        logging.warning(f"Could not load selectors.json: {e}. Using empty fallback.")
+        selectors = {}
+    return selectors
+
 
 __all__ = ["SelectorLoader", "selectors"]
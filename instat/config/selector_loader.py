@@ -1,7 +1,45 @@
+import functools
 import json
 import logging
 import os
-from typing import List
+from typing import Any, Dict, List
+
+
+def _read_json(path: str) -> Dict[str, Any]:
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+@functools.lru_cache(maxsize=8)
+def _read_json_cached(path: str, mtime_ns: int, size: int) -> Dict[str, Any]:
+    return _read_json(path)
+
+
+def _load(path: str) -> Dict[str, Any]:
+    """Parse `path` once per (mtime, size): Utils, SeleniumEngine, InstaLogin
+    and instat.config each build a SelectorLoader, and test suites build
+    many more. Returns a fresh copy so callers can't mutate the cache."""
+    try:
+        st = os.stat(path)
+    except OSError:
+        data = _read_json(path)  # surfaces FileNotFoundError to the caller
+    else:
+        data = _read_json_cached(path, st.st_mtime_ns, st.st_size)
+    return {k: list(v) if isinstance(v, list) else v for k, v in data.items()}
+
+
+class _SelectorNamespace:
+    """`loader.ns.KEY` == `loader.get("KEY")`, AttributeError if missing."""
+    __slots__ = ("_loader",)
+
+    def __init__(self, loader: "SelectorLoader"):
+        self._loader = loader
+
+    def __getattr__(self, name: str) -> str:
+        try:
+            return self._loader.get(name)
+        except KeyError:
+            raise AttributeError(name) from None
 
 
 class SelectorLoader:
@@ -16,7 +54,7 @@ class SelectorLoader:
         {
             "LOGIN_USERNAME_INPUT": "input[name='username']",
             "FOLLOWERS_LINK": [
-                "//a[contains(@href, '/followers/')]",
+                "a[href*='/followers/']",
                 "//a[.//span[contains(text(),'seguidores')]]"
             ]
         }
@@ -27,8 +65,7 @@ class SelectorLoader:
 
         self.selectors = {}
         try:
-            with open(config_path, "r", encoding="utf-8") as f:
-                self.selectors = json.load(f)
+            self.selectors = _load(config_path)
         except FileNotFoundError:
             logging.warning(f"Selector config file not found at: {config_path}. Proceeding with empty config.")
         except json.JSONDecodeError as e:
@@ -36,16 +73,22 @@ class SelectorLoader:
         except Exception as e:
             logging.error(f"Unexpected error loading selector config: {e}. Proceeding with empty config.")
 
+        # Attribute view of the primaries: `loader.ns.IGNORE_BUTTON`. A
+        # missing key raises AttributeError; `get` keeps the KeyError contract.
+        self.ns = _SelectorNamespace(self)
+
     def get(self, key: str) -> str:
         """
         Get the primary selector by key. For lists, returns the first entry.
-        Raises KeyError if not found.
+        Raises KeyError if not found (an empty list counts as not found).
         """
-        if key not in self.selectors:
-            raise KeyError(f"Selector '{key}' not found in selectors config.")
-        value = self.selectors[key]
+        # One lookup against the live dict (so `get` and `get_all` always
+        # agree); the `in` + index pair ran on every scroll/wait iteration.
+        value = self.selectors.get(key)
         if isinstance(value, list):
-            return value[0]
+            value = value[0] if value else None
+        if value is None:
+            raise KeyError(f"Selector '{key}' not found in selectors config.")
         return value
 
     def get_all(self, key: str) -> List[str]:
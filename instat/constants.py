@@ -8,24 +8,30 @@ import random
 import time
 
 # === Login ===
-LOGIN_POST_CLICK_DELAY = 3.0        # login.py: após click do botão de login
-IGNORE_BUTTON_PRE_CLICK = 3.0       # utils.py: wait_before_click em click_ignore_button_if_present
+LOGIN_POST_CLICK_DELAY = 3.0        # legado: login_flow.py agora espera readyState após o click
+IGNORE_BUTTON_PRE_CLICK = 3.0       # legado: click_ignore_button_if_present clica assim que o botão fica clicável
 DISMISS_MODAL_TIMEOUT = 6           # utils.py: timeout em dismiss_save_login_modal
 
 # === Scrolling ===
 SCROLL_PAUSE = 0.5                  # extractor.py: default de self.pause_time
 SCROLL_INNER_PAUSE = 0.4            # utils.py: pause_time dentro de wait_for_new_profiles
 PROFILE_WAIT_INTERVAL = 0.5         # extractor.py: default de self.wait_interval
+SCROLL_MUTATION_TIMEOUT = 2.0       # utils.py: espera máx. (MutationObserver) por novos itens após cada scroll
 
 # === Retry ===
-ELEMENT_RETRY_DELAY = 1.0           # utils.py: entre retries em find_element_safe
-ELEMENTS_RETRY_WAIT = 0.3           # utils.py: wait_time default em find_elements_safe
+ELEMENT_RETRY_DELAY = 1.0           # utils.py: find_element_safe (timeout do WebDriverWait = max_retries × este valor)
+ELEMENTS_RETRY_WAIT = 0.3           # utils.py: wait_time default em find_elements_safe (× max_retries)
 ELEMENTS_RETRY_WAIT_LONG = 0.7      # utils.py: wait_time em wait_for_new_profiles
 SPINNER_WAIT_TIMEOUT = 5            # utils.py: WebDriverWait para spinner desaparecer
+REFRESH_BACKOFF_BASE = 2.0          # selenium_engine.py: 1º delay antes de driver.refresh()
+REFRESH_BACKOFF_GROWTH = 1.5        # selenium_engine.py: fator por refresh consecutivo
+REFRESH_BACKOFF_MAX = 30.0          # selenium_engine.py: teto do delay de refresh (antes: 300)
 
 # === Performance (PERF-01) ===
 LOADING_SPINNER_WAIT = 1.0          # utils.py: max wait para spinner desaparecer (antes: 5.0)
 COOKIE_RESTORE_REFRESH_TIMEOUT = 5  # login.py: timeout após refresh no session restore
+WAIT_POLL_FREQUENCY = 0.2           # WebDriverWait compartilhado (engine/modal/login_flow); default Selenium: 0.5
+SAVE_LOGIN_DISMISS_WAIT = 2.0       # utils.py: max wait para o diálogo 'Save login info' sumir após o clique (antes: sleep fixo de ~1s)
 
 
 def human_delay(base: float, variance: float = 0.3) -> float:
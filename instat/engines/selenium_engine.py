@@ -5,10 +5,11 @@ modal e profile extraction que antes estava em InstaExtractor.
 """
 import re
 import time
+from functools import cached_property
 from typing import Callable, List, Optional, Set
 
 from loguru import logger
-from selenium.common.exceptions import StaleElementReferenceException, TimeoutException, WebDriverException
+from selenium.common.exceptions import TimeoutException, WebDriverException
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.support.ui import WebDriverWait
@@ -17,7 +18,15 @@ try:
     from instat.backoff import SmartBackoff
     from instat.checkpoint import ExtractionCheckpoint
     from instat.config.selector_loader import SelectorLoader
-    from instat.constants import PROFILE_WAIT_INTERVAL, SCROLL_PAUSE, human_delay
+    from instat.constants import (
+        PROFILE_WAIT_INTERVAL,
+        REFRESH_BACKOFF_BASE,
+        REFRESH_BACKOFF_GROWTH,
+        REFRESH_BACKOFF_MAX,
+        SCROLL_PAUSE,
+        WAIT_POLL_FREQUENCY,
+        human_delay,
+    )
     from instat.engines.base import BaseEngine
     from instat.exceptions import BlockedError
     from instat.login import InstaLogin
@@ -28,7 +37,15 @@ except ImportError:
     from backoff import SmartBackoff
     from checkpoint import ExtractionCheckpoint
     from config.selector_loader import SelectorLoader
-    from constants import PROFILE_WAIT_INTERVAL, SCROLL_PAUSE, human_delay
+    from constants import (
+        PROFILE_WAIT_INTERVAL,
+        REFRESH_BACKOFF_BASE,
+        REFRESH_BACKOFF_GROWTH,
+        REFRESH_BACKOFF_MAX,
+        SCROLL_PAUSE,
+        WAIT_POLL_FREQUENCY,
+        human_delay,
+    )
     from engines.base import BaseEngine
     from exceptions import BlockedError
     from login import InstaLogin
@@ -37,6 +54,18 @@ except ImportError:
     from utils import Utils
 
 
+# Count parsing (profile header "1.234", "1,2 mil", "3M"). Compiled once:
+# _parse_count runs on every get_total_count / _extract_list call.
+# str.translate beats re.sub for short strings. The table holds every
+# code point str.isspace() accepts — exactly what the old `\s+` stripped
+# (NBSP, figure/narrow/thin spaces, U+3000...). All of them are < U+3001.
+_STRIP_TABLE = dict.fromkeys(c for c in range(0x3001) if chr(c).isspace())
+_COUNT_RE = re.compile(r"(\d+)[\.,]?(\d+)?(k|m|mi|mil)?")
+# Every suffix (k, m, mi, mil) contains 'k' or 'm'.
+_SUFFIX_CHARS = frozenset("km")
+_SUFFIX_MULTIPLIER = {"k": 1_000, "mil": 1_000, "m": 1_000_000, "mi": 1_000_000}
+
+
 class SeleniumEngine(BaseEngine):
     """
     Engine de extração via Selenium/Firefox.
@@ -59,9 +88,13 @@ class SeleniumEngine(BaseEngine):
 
     def __init__(self, headless=True, timeout=10, _login_class=None,
                  proxy: Optional[str] = None, base_url: Optional[str] = None,
-                 imap_config=None, **kwargs):
+                 imap_config=None, disable_images: bool = True,
+                 page_load_strategy: str = 'eager', **kwargs):
         self.headless = headless
         self.timeout = timeout
+        # Repassados a InstaLogin.init_driver no login().
+        self.disable_images = disable_images
+        self.page_load_strategy = page_load_strategy
         self._login_class = _login_class or InstaLogin
         self._proxy = proxy  # stored for BL-13 integration with FirefoxOptions
         self._base_url = base_url or self.INSTAGRAM_BASE_URL
@@ -69,12 +102,18 @@ class SeleniumEngine(BaseEngine):
         self._login_obj = None
         self._driver = None
         self._modal: Optional[ModalInteraction] = None  # built lazily post-login
+        self._wait: Optional[WebDriverWait] = None  # built lazily, see _get_wait
+        self._wait_key = None
         self._session_cache = SessionCache()
         self._selectors = SelectorLoader()
         self._save_login_dismissed = False  # PERF-01 Fix 4: skip dismiss after first call
 
         # Extraction parameters (same defaults as old InstaExtractor)
-        self.max_refresh_attempts = 100
+        # Page refreshes do helper legado _handle_profile_count.
+        self.max_refresh_attempts = 5
+        # Recuperações (reopen do modal) de _get_profiles quando a lista
+        # trava: cada uma é mais uma navegação que o IG pode responder com 429.
+        self.max_reopen_attempts = 3
         self.wait_interval = PROFILE_WAIT_INTERVAL
         self.additional_scroll_attempts = 1
         self.pause_time = SCROLL_PAUSE
@@ -88,7 +127,11 @@ class SeleniumEngine(BaseEngine):
         # 50 profiles num alvo de 850k.
         self.warmup_threshold = 200
         self.warmup_stale_rounds = 10
-        self._backoff = SmartBackoff()
+        # Cooldown antes de retomar após cada reopen: 2s, 3s, 4.5s... até 30s.
+        self._backoff = SmartBackoff(
+            base=REFRESH_BACKOFF_GROWTH, max_delay=REFRESH_BACKOFF_MAX,
+            scale=REFRESH_BACKOFF_BASE,
+        )
         self.checkpoint_interval = 100
         # PERF-02: cobertura abaixo deste threshold levanta BlockedError
         # para permitir fallback para próxima engine (checkpoint preservado).
@@ -102,6 +145,8 @@ class SeleniumEngine(BaseEngine):
             session_cache=self._session_cache,
             base_url=self._base_url,
             imap_config=self._imap_config,
+            disable_images=self.disable_images,
+            page_load_strategy=self.page_load_strategy,
         )
         self._login_obj.login()
         self._driver = self._login_obj.driver
@@ -125,11 +170,7 @@ class SeleniumEngine(BaseEngine):
         if not link:
             return None
         try:
-            parts = link.text.split()
-            raw = parts[0]
-            if len(parts) > 1 and parts[1].lower() in ("k", "m", "mi", "mil"):
-                raw += parts[1]
-            total_count = self._parse_count(raw)
+            total_count = self._read_link_count(link)
             logger.debug("Parsed total {}: {}", list_type, total_count)
             return total_count
         except (ValueError, IndexError) as e:
@@ -147,28 +188,79 @@ class SeleniumEngine(BaseEngine):
     def _parse_count(text: str) -> int:
         if not text:
             raise ValueError("Input is None or empty")
-        txt = re.sub(r"\s+", "", text.lower())
-        if not any(suffix in txt for suffix in ["k", "m", "mi", "mil"]):
+        # Fast path: plain counts ("42", "1,234", "1.234") skip the regex.
+        s = text.strip()
+        if s.isdecimal():
+            return int(s)
+        plain = s.replace(",", "").replace(".", "")
+        if plain.isdecimal():
+            return int(plain)
+        txt = text.lower().translate(_STRIP_TABLE)
+        if _SUFFIX_CHARS.isdisjoint(txt):
             txt = txt.replace(".", "").replace(",", "")
-        m = re.fullmatch(r"(\d+)[\.,]?(\d+)?(k|m|mi|mil)?", txt)
+        m = _COUNT_RE.fullmatch(txt)
         if not m:
             raise ValueError(f"Unrecognized count format: '{text}'")
         int_part, decimal_part, suffix = m.groups()
-        int_val = int(int_part)
-        dec_val = int(decimal_part) if decimal_part else 0
-        multiplier = 1
-        if suffix == "k":
-            multiplier = 1_000
-        elif suffix in ("m", "mi"):
-            multiplier = 1_000_000
-        elif suffix == "mil":
-            multiplier = 1_000
-        total = int_val * multiplier
-        if decimal_part:
-            decimal_digits = len(decimal_part)
-            factor = multiplier // (10 ** decimal_digits)
-            total += dec_val * factor
-        return total
+        num_str = f"{int_part}.{decimal_part}" if decimal_part else int_part
+        # round(), not int(): float("4.1") * 1000 == 4099.999...
+        return round(float(num_str) * _SUFFIX_MULTIPLIER.get(suffix, 1))
+
+    # Exact count exposed as an attribute on the link or a descendant
+    # (e.g. <span title="1,234">1.2k</span>); read in one IPC.
+    # Primeiro candidato com dígitos: um title/aria-label só de texto
+    # ("Followers") no link não pode esconder o title numérico de dentro.
+    _LINK_EXACT_COUNT_JS = (
+        "const a = arguments[0];"
+        "const t = a.querySelector('[title]');"
+        "const cands = [a.getAttribute('title'), a.getAttribute('aria-label'),"
+        " t ? t.getAttribute('title') : null];"
+        "return cands.find(c => c && /[0-9]/.test(c)) || null;"
+    )
+
+    def _read_link_count(self, link) -> int:
+        """Total for a followers/following link. Prefers the exact value
+        in title/aria-label — the visible text is abbreviated ("1.2k"),
+        and a truncated expected_count ends the scroll loop late or
+        early. Falls back to parsing the text. Raises ValueError /
+        IndexError when neither yields a count."""
+        exact = self._link_exact_count(link)
+        if exact is not None:
+            return exact
+        parts = link.text.split()
+        raw = parts[0]
+        if len(parts) > 1 and parts[1].lower() in ("k", "m", "mi", "mil"):
+            raw += parts[1]
+        return self._parse_count(raw)
+
+    def _link_exact_count(self, link) -> Optional[int]:
+        try:
+            raw = self._driver.execute_script(self._LINK_EXACT_COUNT_JS, link)
+        except Exception:
+            return None
+        if not isinstance(raw, str) or not raw.strip():
+            return None
+        # "1,234,567 followers" / "Followers: 1.234.567" — o 1º token com
+        # dígitos; abreviado ("1.2M") não é exato e cai no texto.
+        token = next((tok for tok in raw.split() if any(c.isdigit() for c in tok)), "")
+        token = token.replace(",", "").replace(".", "")
+        return int(token) if token.isdecimal() else None
+
+    # Seletores do scroll loop: resolvidos no primeiro uso e cacheados —
+    # o loop e seus helpers leem a cada round. Via get(), não no __init__:
+    # um selectors.json ausente/vazio (tolerado pelo SelectorLoader) só
+    # falha quando o seletor é usado, com o KeyError descritivo do loader.
+    @cached_property
+    def _sel_profile_span(self) -> str:
+        return self._selectors.get("PROFILE_USERNAME_SPAN")
+
+    @cached_property
+    def _sel_close_modal(self) -> str:
+        return self._selectors.get("CLOSE_MODAL_BUTTON")
+
+    @cached_property
+    def _sel_scroll_container(self) -> str:
+        return self._selectors.get("MODAL_SCROLL_CONTAINER")
 
     def _get_modal(self) -> ModalInteraction:
         """Lazy-built ModalInteraction. Requires self._driver (post-login)."""
@@ -182,6 +274,17 @@ class SeleniumEngine(BaseEngine):
             )
         return self._modal
 
+    def _get_wait(self) -> WebDriverWait:
+        """WebDriverWait shared by every explicit wait on self._driver.
+        Rebuilt only when the driver or timeout changes (re-login, tuning)."""
+        key = (id(self._driver), self.timeout)
+        if getattr(self, '_wait', None) is None or self._wait_key != key:
+            self._wait = WebDriverWait(
+                self._driver, self.timeout, poll_frequency=WAIT_POLL_FREQUENCY
+            )
+            self._wait_key = key
+        return self._wait
+
     def _dismiss_save_login_once(self) -> None:
         """Callback plugged into ModalInteraction. Runs the
         save-login-info dismiss only on the first navigation per
@@ -226,11 +329,7 @@ class SeleniumEngine(BaseEngine):
             return list(existing) if existing else []
 
         try:
-            parts = link.text.split()
-            raw = parts[0]
-            if len(parts) > 1 and parts[1].lower() in ("k", "m", "mi", "mil"):
-                raw += parts[1]
-            total_count = self._parse_count(raw)
+            total_count = self._read_link_count(link)
             logger.debug("Parsed total {}: {}", list_type, total_count)
         except (ValueError, IndexError) as e:
             logger.exception("Error parsing {} count: {}", list_type, e)
@@ -261,9 +360,9 @@ class SeleniumEngine(BaseEngine):
         ckpt.clear()
 
         try:
-            close_button = WebDriverWait(self._driver, self.timeout).until(
+            close_button = self._get_wait().until(
                 EC.element_to_be_clickable(
-                    (By.XPATH, self._selectors.get("CLOSE_MODAL_BUTTON"))
+                    Utils.locator(self._sel_close_modal)
                 )
             )
             close_button.click()
@@ -288,7 +387,8 @@ class SeleniumEngine(BaseEngine):
 
         Estratégia PERF-03:
         - Re-localiza container via JS a cada scroll (evita stale refs).
-        - Scroll em 1 IPC JS + batch_read_text em 1 IPC.
+        - Scroll em 1 IPC JS + batch_read_text incremental em 1 IPC
+          (só os nós novos desde o round anterior).
         - Rate limit do IG: após ~150 perfis em burst, servidor para de entregar.
           Recovery: fecha e reabre o modal (reset do cursor de paginação).
         - Para de vez quando mesmo após reopen não trouxe novos.
@@ -299,7 +399,7 @@ class SeleniumEngine(BaseEngine):
             logger.info(f"Starting with {len(unique_profiles)} profiles from checkpoint.")
         _last_checkpoint_count = len(unique_profiles)
 
-        profile_selector = self._selectors.get("PROFILE_USERNAME_SPAN")
+        profile_selector = self._sel_profile_span
         stale_rounds = 0
         reopen_attempts = 0
         # Targets populares (milhões de followers) costumam demorar a
@@ -308,7 +408,8 @@ class SeleniumEngine(BaseEngine):
         # Durante os primeiros `warmup_threshold` perfis, usamos um
         # limite maior (warmup_stale_rounds) antes de declarar rate-limit.
         MAX_STALE_ROUNDS = 4
-        MAX_REOPEN_ATTEMPTS = 3
+        max_reopen_attempts = self.max_reopen_attempts
+        self._backoff.reset()
 
         while True:
             if self._is_max_duration_exceeded(start_time, max_duration):
@@ -327,8 +428,11 @@ class SeleniumEngine(BaseEngine):
             # Small delay for lazy-load to render
             human_delay(self.pause_time, variance=0.2)
 
-            # Batch-read usernames via JS
-            snapshot = Utils.batch_read_text(self._driver, profile_selector)
+            # Batch-read usernames via JS — only nodes not yet read, or
+            # recycled with a new username (marks reset on navigation).
+            snapshot = Utils.batch_read_text(
+                self._driver, profile_selector, incremental=True
+            )
             unique_profiles |= snapshot
 
             new_added = len(unique_profiles) - count_before
@@ -360,9 +464,9 @@ class SeleniumEngine(BaseEngine):
                     self.warmup_stale_rounds if in_warmup else MAX_STALE_ROUNDS
                 )
                 logger.debug(
-                    f"No new profiles in this round. Stale rounds: "
-                    f"{stale_rounds}/{effective_limit}"
-                    f"{' (warmup)' if in_warmup else ''}"
+                    "No new profiles in this round. Stale rounds: {}/{}{}",
+                    stale_rounds, effective_limit,
+                    " (warmup)" if in_warmup else "",
                 )
                 # Telemetry for BlockPredictor (opt-in via setattr on engine).
                 predictor = getattr(self, '_block_predictor', None)
@@ -380,11 +484,14 @@ class SeleniumEngine(BaseEngine):
                     # PERF-03 Solução G: rate limit detectado — tenta reopen modal
                     # para reset do cursor de paginação do Instagram.
                     if (profile_id and list_type
-                            and reopen_attempts < MAX_REOPEN_ATTEMPTS):
+                            and reopen_attempts < max_reopen_attempts):
+                        if self._is_max_duration_exceeded(start_time, max_duration):
+                            logger.info("Max duration reached, not reopening modal.")
+                            break
                         reopen_attempts += 1
                         logger.info(
                             f"Rate limit suspected after {len(unique_profiles)} profiles. "
-                            f"Reopening modal (attempt {reopen_attempts}/{MAX_REOPEN_ATTEMPTS})..."
+                            f"Reopening modal (attempt {reopen_attempts}/{max_reopen_attempts})..."
                         )
                         reopen_ok = self._reopen_modal(profile_id, list_type)
                         if predictor is not None and not reopen_ok:
@@ -401,8 +508,10 @@ class SeleniumEngine(BaseEngine):
                                 )
                         if reopen_ok:
                             stale_rounds = 0
-                            # Cooldown anti-detecção antes de retomar
-                            human_delay(3.0, variance=1.0)
+                            # Cooldown anti-detecção antes de retomar,
+                            # crescente entre reopens seguidos sem progresso.
+                            delay = self._backoff.wait()
+                            logger.info(f"Modal reopened; resuming after {delay:.1f}s backoff.")
                             continue
                         else:
                             logger.warning("Reopen failed — stopping extraction.")
@@ -416,6 +525,7 @@ class SeleniumEngine(BaseEngine):
                 human_delay(self.wait_interval, variance=0.2)
             else:
                 stale_rounds = 0
+                self._backoff.reset()
                 logger.info(f"Collected {len(unique_profiles)} out of {expected_count} expected profiles (+{new_added}).")
 
         elapsed = time.perf_counter() - start_time
@@ -499,7 +609,7 @@ class SeleniumEngine(BaseEngine):
         try:
             modal = Utils.find_element_safe(
                 self._driver, By.CSS_SELECTOR,
-                self._selectors.get('MODAL_SCROLL_CONTAINER'),
+                self._sel_scroll_container,
                 max_retries=2
             )
             if modal:
@@ -523,10 +633,18 @@ class SeleniumEngine(BaseEngine):
             return True
         return False
 
+    # --- Legacy scroll-loop helpers ---
+    # _get_profiles NÃO chama nenhum dos helpers abaixo: ele rola via
+    # _scroll_modal_js, lê com batch_read_text(incremental=True) e se
+    # recupera com reopen do modal (max_reopen_attempts). Mantidos para
+    # compatibilidade com subclasses/scripts que montam o loop antigo
+    # (page refresh, limitado por max_refresh_attempts); otimizações
+    # aqui não mudam a extração padrão.
+
     def _perform_dynamic_scroll(self, body):
         Utils.dynamic_scroll_element(
             self._driver, body,
-            item_selector=self._selectors.get("PROFILE_USERNAME_SPAN"),
+            item_selector=self._sel_profile_span,
             pause_time=self.pause_time,
             max_attempts=self.max_attempts
         )
@@ -535,45 +653,63 @@ class SeleniumEngine(BaseEngine):
         Utils.wait_for_new_profiles(
             driver=self._driver,
             scrollable_element=body,
-            profile_selector=self._selectors.get("PROFILE_USERNAME_SPAN"),
+            profile_selector=self._sel_profile_span,
             existing_profiles=unique_profiles,
             wait_interval=self.wait_interval,
             additional_scroll_attempts=self.additional_scroll_attempts
         )
 
-    def _extract_visible_profiles(self, unique_profiles: set) -> bool:
-        new_profiles_found = False
-        try:
-            profile_elements = Utils.find_elements_safe(
-                self._driver, By.CSS_SELECTOR, self._selectors.get("PROFILE_USERNAME_SPAN")
-            )
-            for element in profile_elements:
-                try:
-                    profile_name = element.text.strip()
-                    if profile_name and profile_name not in unique_profiles:
-                        unique_profiles.add(profile_name)
-                        new_profiles_found = True
-                except StaleElementReferenceException:
-                    continue
-        except StaleElementReferenceException:
-            logger.warning("StaleElementReferenceException encountered. Retrying extraction.")
-        return new_profiles_found
-
-    def _handle_profile_count(self, new_profiles_found, previous_count, try_count, refresh_attempts):
-        current_count = previous_count + (1 if new_profiles_found else 0)
+    def _extract_visible_profiles(self, unique_profiles: set) -> int:
+        """Adds the usernames currently in the DOM to `unique_profiles` and
+        returns its new size (feed it to _handle_profile_count).
+        One JS IPC via batch_read_text instead of one `.text` per element;
+        no WebElement refs are kept, so there is nothing to go stale."""
+        unique_profiles |= Utils.batch_read_text(
+            self._driver, self._sel_profile_span,
+            incremental=True,
+        )
+        return len(unique_profiles)
+
+    def _handle_profile_count(self, current_count, previous_count, try_count, refresh_attempts):
+        """`current_count` is the real len(unique_profiles) (see
+        _extract_visible_profiles). Returns (refresh_attempts, try_count,
+        previous_count) for the next round."""
         if current_count > previous_count:
-            logger.debug(f"Found new profiles, total now {current_count}")
+            logger.debug("Found new profiles, total now {}", current_count)
             self._backoff.reset()
             return refresh_attempts, 0, current_count
 
         try_count += 1
-        logger.debug(f"No new profiles detected. Retry attempt {try_count}/{self.max_retry_without_new_profiles}")
+        logger.debug("No new profiles detected. Retry attempt {}/{}",
+                     try_count, self.max_retry_without_new_profiles)
 
-        if try_count > self.max_retry_without_new_profiles:
+        if (try_count > self.max_retry_without_new_profiles
+                and refresh_attempts < self.max_refresh_attempts):
             refresh_attempts += 1
             delay = self._backoff.wait()
             logger.info(f"No new profiles after several attempts. Backoff {delay:.1f}s (attempt {self._backoff.attempt}), refreshing page.")
             self._driver.refresh()
-            return refresh_attempts, 0, 0
+            self._wait_page_ready()
+            # unique_profiles survives the refresh, so the baseline is
+            # still the real count — resetting to 0 would make the next
+            # round look like progress.
+            return refresh_attempts, 0, current_count
 
         return refresh_attempts, try_count, previous_count
+
+    def _wait_page_ready(self) -> None:
+        """Explicit wait after driver.refresh(): document.readyState ==
+        'complete', then the first username span. Returns as soon as the
+        page is usable instead of sleeping a fixed interval."""
+        try:
+            wait = self._get_wait()
+            wait.until(
+                lambda d: d.execute_script("return document.readyState") == "complete"
+            )
+            wait.until(
+                EC.presence_of_element_located(
+                    (By.CSS_SELECTOR, self._sel_profile_span)
+                )
+            )
+        except TimeoutException:
+            logger.debug("Page not ready after refresh within timeout. Proceeding anyway.")
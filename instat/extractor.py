@@ -1,43 +1,11 @@
 # Built-in
 import re
-import sys
 import time
 from typing import Dict, List, Optional
 
-# Instagram username rules: 1-30 chars, ASCII letters/digits/dot/underscore.
-# Prevents path traversal ('../admin'), URL query/fragment injection
-# ('x?y=1', 'x#frag'), and unicode confusables from reaching
-# f"https://www.instagram.com/{profile_id}/" construction.
-_PROFILE_ID_RE = re.compile(r'^[A-Za-z0-9._]{1,30}$')
-
-
-def _validate_profile_id(profile_id: str) -> None:
-    if not isinstance(profile_id, str) or not _PROFILE_ID_RE.match(profile_id):
-        raise ValueError(
-            f"Invalid profile_id {profile_id!r}: must match "
-            f"[A-Za-z0-9._]{{1,30}} (Instagram username rules)."
-        )
-
 # Third-party
 from loguru import logger
 
-# Configure Loguru logger for this module
-logger.remove()
-logger.add(
-    sys.stderr,
-    level="DEBUG",
-    colorize=True,
-    backtrace=True,
-    diagnose=False,
-    format=(
-        "<green>{time:YYYY-MM-DD HH:mm:ss.SSS}</green> | "
-        "<level>{level: <8}</level> | "
-        "<cyan>{name}</cyan>:<cyan>{function}</cyan>:<cyan>{line}</cyan> - "
-        "<level>{message}</level>"
-    )
-)
-logger.add("instat/logs/insta_extractor.log", rotation="10 MB", retention="10 days", level="DEBUG", backtrace=True, diagnose=False)
-
 try:
     from instat.engines.engine_manager import EngineManager
     from instat.engines.selenium_engine import SeleniumEngine
@@ -55,6 +23,20 @@ except ImportError:
     from proxy import ProxyPool
     from session_pool import SessionPool
 
+# Instagram username rules: 1-30 chars, ASCII letters/digits/dot/underscore.
+# Prevents path traversal ('../admin'), URL query/fragment injection
+# ('x?y=1', 'x#frag'), and unicode confusables from reaching
+# f"https://www.instagram.com/{profile_id}/" construction.
+_PROFILE_ID_RE = re.compile(r'^[A-Za-z0-9._]{1,30}$')
+
+
+def _validate_profile_id(profile_id: str) -> None:
+    if not isinstance(profile_id, str) or not _PROFILE_ID_RE.match(profile_id):
+        raise ValueError(
+            f"Invalid profile_id {profile_id!r}: must match "
+            f"[A-Za-z0-9._]{{1,30}} (Instagram username rules)."
+        )
+
 
 class InstaExtractor:
     """
@@ -68,7 +50,7 @@ class InstaExtractor:
     extractor = InstaExtractor(username="your_username", password="your_password", headless=False)
 
     # Set parameters (Optional - uses defaults if not provided)
-    extractor.max_refresh_attempts = 10
+    extractor.max_reopen_attempts = 2
     extractor.wait_interval = 0.5
     extractor.additional_scroll_attempts = 3
     extractor.pause_time = 0.5
@@ -80,7 +62,10 @@ class InstaExtractor:
 
     Available Attributes for Configuration:
     ---------------------------------------
-    - max_refresh_attempts (int): Max page refreshes. Default: 100.
+    - max_reopen_attempts (int): Max modal reopens when the list stalls. Default: 3.
+      0 disables the recovery (the list ends at the first stall).
+    - max_refresh_attempts (int): Max page refreshes in the legacy refresh
+      helper; the scroll loop recovers by reopening instead. Default: 5.
     - wait_interval (float): Wait between profile checks (seconds). Default: 0.5.
     - additional_scroll_attempts (int): Extra scroll attempts. Default: 1.
     - pause_time (float): Pause between scrolls (seconds). Default: 0.5.
@@ -97,7 +82,10 @@ class InstaExtractor:
                  exporter: Optional[BaseExporter] = None,
                  imap_config=None,
                  completion_threshold: Optional[float] = None,
-                 block_predictor=None) -> None:
+                 block_predictor=None,
+                 disable_images: bool = True,
+                 page_load_strategy: str = 'eager',
+                 _driver=None) -> None:
         """
         engines: lista de nomes ['selenium', 'playwright', 'httpx']. Default: ['selenium'].
         exporter: exporter opcional chamado após cada extração bem-sucedida.
@@ -115,7 +103,15 @@ class InstaExtractor:
           essa combinação é detectada. Para coletar "o que der", use
           `completion_threshold=None` (default) + `get_*_until_complete`
           ao invés disso — o wrapper acumula parciais entre retries.
+        disable_images: bloqueia imagens no Firefox dos engines Selenium.
+          Default True; passe False se precisar da página completa.
+        page_load_strategy: 'eager' (default) ou 'normal' para esperar
+          todos os subrecursos em driver.get().
+        _driver: WebDriver já logado (uso interno de `from_driver`); pula o
+          login do engine primário.
         """
+        if _driver is not None and accounts:
+            raise ValueError("_driver cannot be combined with accounts")
         self.username = username
         self.password = password
         self.timeout = timeout
@@ -125,6 +121,8 @@ class InstaExtractor:
         # with consistent configuration when rotating through fallback
         # accounts. Not part of the public API.
         self._headless = headless
+        self._disable_images = disable_images
+        self._page_load_strategy = page_load_strategy
         self._engine_names = list(engines or ['selenium'])
         if completion_threshold is not None and not (0 < completion_threshold <= 1):
             raise ValueError(
@@ -185,7 +183,17 @@ class InstaExtractor:
 
         # Login inicial APENAS se não houver session_pool.
         # Com session_pool, o EngineManager faz login sob demanda por session.
-        if session_pool is None:
+        if _driver is not None:
+            if not hasattr(primary_engine, '_driver'):
+                raise ValueError(
+                    f"from_driver needs a Selenium primary engine, got {primary_engine.name}"
+                )
+            primary_engine._driver = _driver
+            self._engine = primary_engine
+            self.driver = _driver
+            self.insta_login = None
+            logger.info("InstaExtractor: reusing existing WebDriver session")
+        elif session_pool is None:
             try:
                 primary_engine.login(username, password)
                 self._engine = primary_engine
@@ -207,10 +215,25 @@ class InstaExtractor:
             session_pool=session_pool,
             default_credentials=(username, password),
         )
-        # Primary engine já fez login — não tentar de novo
+        # Primary engine já fez login (ou recebeu driver) — não tentar de novo
         if session_pool is None:
             self._engine_manager._logged_in_engines.add(id(primary_engine))
 
+    @classmethod
+    def from_driver(cls, driver, username: str = "", password: str = "",
+                    **kwargs) -> 'InstaExtractor':
+        """Extractor sobre um WebDriver já aberto e logado — pula o launch
+        do Firefox + login (5-15s) que domina o custo fixo. username e
+        password só são usados se a cascata precisar logar engines
+        secundárias. `quit()` fecha o driver recebido."""
+        return cls(username, password, _driver=driver, **kwargs)
+
+    def __enter__(self) -> 'InstaExtractor':
+        return self
+
+    def __exit__(self, *_) -> None:
+        self.quit()
+
     def _build_engines(self, names: List[str], headless: bool, timeout: int):
         """
         Converte nomes em instâncias de engines.
@@ -226,7 +249,9 @@ class InstaExtractor:
         for name in names:
             if name == 'selenium':
                 built.append(SeleniumEngine(
-                    headless=headless, timeout=timeout, _login_class=InstaLogin
+                    headless=headless, timeout=timeout, _login_class=InstaLogin,
+                    disable_images=self._disable_images,
+                    page_load_strategy=self._page_load_strategy,
                 ))
             elif name == 'playwright':
                 eng = PlaywrightEngine(headless=headless, timeout=timeout * 1000)
@@ -252,14 +277,29 @@ class InstaExtractor:
 
     # --- Configurable attributes delegated to engine ---
 
+    @staticmethod
+    def _check_attempts(name: str, v) -> None:
+        if isinstance(v, bool) or not isinstance(v, int) or v < 0:
+            raise ValueError(f"{name} must be a non-negative int, got {v!r}")
+
     @property
     def max_refresh_attempts(self):
         return self._engine.max_refresh_attempts
 
     @max_refresh_attempts.setter
     def max_refresh_attempts(self, v):
+        self._check_attempts('max_refresh_attempts', v)
         self._engine.max_refresh_attempts = v
 
+    @property
+    def max_reopen_attempts(self):
+        return self._engine.max_reopen_attempts
+
+    @max_reopen_attempts.setter
+    def max_reopen_attempts(self, v):
+        self._check_attempts('max_reopen_attempts', v)
+        self._engine.max_reopen_attempts = v
+
     @property
     def wait_interval(self):
         return self._engine.wait_interval
@@ -403,6 +443,20 @@ class InstaExtractor:
         _validate_profile_id(profile_id)
         return self._extract_with_export(profile_id, 'following', max_duration)
 
+    def get_many(self, profile_ids: List[str], kind: str = 'followers',
+                 max_duration: Optional[float] = None) -> Dict[str, List[str]]:
+        """Extrai `kind` ('followers' ou 'following') de vários perfis na
+        mesma sessão de browser, sem quit/login entre eles.
+        max_duration vale por perfil. Exceções propagam com a sessão
+        intacta — o caller decide se segue ou chama quit()."""
+        if kind not in ('followers', 'following'):
+            raise ValueError(f"kind must be 'followers' or 'following', got {kind!r}")
+        extract = self.get_followers if kind == 'followers' else self.get_following
+        results: Dict[str, List[str]] = {}
+        for profile_id in profile_ids:
+            results[profile_id] = extract(profile_id, max_duration=max_duration)
+        return results
+
     def _extract_until_complete(self, profile_id: str, list_type: str,
                                 target_fraction: float, max_retries: int,
                                 retry_wait_s: float,
@@ -691,8 +745,8 @@ class InstaExtractor:
     ) -> "InstaExtractor":
         """Factory for fresh extractors during rotation.
 
-        Inherits imap_config, engines, completion_threshold, timeout and
-        headless from `self`. Each call performs a full login (may
+        Inherits imap_config, engines, completion_threshold, timeout,
+        headless and the driver options from `self`. Each call performs a full login (may
         trigger IMAP challenge). Caller is responsible for .quit().
         """
         return InstaExtractor(
@@ -704,6 +758,8 @@ class InstaExtractor:
             imap_config=self._imap_config,
             completion_threshold=self._completion_threshold_override,
             block_predictor=self._block_predictor,
+            disable_images=self._disable_images,
+            page_load_strategy=self._page_load_strategy,
         )
 
     def get_followers_with_rotation(
@@ -989,6 +1045,15 @@ class InstaExtractor:
         _validate_profile_id(profile_id)
         from concurrent.futures import ThreadPoolExecutor
 
+        # Cookies lidos aqui, antes do pool: o worker A já estará dirigindo
+        # o mesmo WebDriver, e a sessão do geckodriver não é thread-safe.
+        driver = getattr(self._engine, '_driver', None)
+        cookie_error = None
+        try:
+            cookies = driver.get_cookies() if driver is not None else None
+        except Exception as e:
+            cookies, cookie_error = None, e
+
         def _do_followers():
             return self._extract_with_export(profile_id, 'followers', max_duration)
 
@@ -1000,10 +1065,10 @@ class InstaExtractor:
             eng = HttpxEngine(timeout=self.timeout)
             if not eng.is_available:
                 raise RuntimeError('httpx not installed')
-            driver = getattr(self._engine, '_driver', None)
             if driver is None:
                 raise RuntimeError('no selenium driver for cookie handoff')
-            cookies = driver.get_cookies()
+            if cookie_error is not None:
+                raise cookie_error
             eng.login_with_cookies(cookies)
             try:
                 result = eng.extract(profile_id, 'following',
@@ -1015,7 +1080,9 @@ class InstaExtractor:
         def _do_following_selenium2():
             """Fallback: 2º SeleniumEngine em paralelo (sessão separada)."""
             eng = SeleniumEngine(headless=True, timeout=self.timeout,
-                                 _login_class=InstaLogin)
+                                 _login_class=InstaLogin,
+                                 disable_images=self._disable_images,
+                                 page_load_strategy=self._page_load_strategy)
             eng.login(self.username, self.password)
             try:
                 return list(eng.extract(profile_id, 'following',
@@ -1136,30 +1203,8 @@ class InstaExtractor:
 
     @staticmethod
     def parse_count_text(text: str) -> int:
-        if not text:
-            raise ValueError("Input is None or empty")
-        txt = re.sub(r"\s+", "", text.lower())
-        if not any(suffix in txt for suffix in ["k", "m", "mi", "mil"]):
-            txt = txt.replace(".", "").replace(",", "")
-        m = re.fullmatch(r"(\d+)[\.,]?(\d+)?(k|m|mi|mil)?", txt)
-        if not m:
-            raise ValueError(f"Unrecognized count format: '{text}'")
-        int_part, decimal_part, suffix = m.groups()
-        int_val = int(int_part)
-        dec_val = int(decimal_part) if decimal_part else 0
-        multiplier = 1
-        if suffix == "k":
-            multiplier = 1_000
-        elif suffix in ("m", "mi"):
-            multiplier = 1_000_000
-        elif suffix == "mil":
-            multiplier = 1_000
-        total = int_val * multiplier
-        if decimal_part:
-            decimal_digits = len(decimal_part)
-            factor = multiplier // (10 ** decimal_digits)
-            total += dec_val * factor
-        return total
+        """Delegates to SeleniumEngine._parse_count (single implementation)."""
+        return SeleniumEngine._parse_count(text)
 
     def quit(self) -> None:
         """Closes the underlying WebDriver instance."""
@@ -1169,11 +1214,10 @@ class InstaExtractor:
 if __name__ == '__main__':
     username = "your_username"
     password = "your_password"
-    extractor = InstaExtractor(username, password, headless=False)
-    try:
-        followers = extractor.get_followers("tiagopsilv", max_duration=30.0)
-        print("Followers:", followers)
+    # Um launch + login para todos os perfis; quit() ao sair do bloco.
+    with InstaExtractor(username, password, headless=False) as extractor:
+        followers = extractor.get_many(["tiagopsilv", "instagram"], max_duration=30.0)
+        for profile_id, names in followers.items():
+            print(f"{profile_id} followers:", names)
         following = extractor.get_following("tiagopsilv")
         print("Following:", following)
-    finally:
-        extractor.quit()
@@ -1,5 +1,4 @@
 import os
-import sys
 from datetime import datetime
 from pathlib import Path
 from urllib.parse import urlsplit, urlunsplit
@@ -12,51 +11,28 @@ from selenium.common.exceptions import (
 from selenium.webdriver.firefox.service import Service
 from webdriver_manager.firefox import GeckoDriverManager
 
-# (constants no longer needed here — moved to login_flow.py)
-try:
-    from instat.exceptions import AccountBlockedError
-except ImportError:
-    from exceptions import AccountBlockedError
 try:
     from instat.block_detector import BlockDetector, BlockInfo
-except ImportError:
-    from block_detector import BlockDetector, BlockInfo  # type: ignore
-try:
     from instat.challenge_resolvers import (
         ChallengeResolverChain,
         EmailChallengeResolver,
     )
+    from instat.config.selector_loader import SelectorLoader
+    from instat.exceptions import AccountBlockedError
+    from instat.login_flow import FormLogin, SessionRestorer
+    from instat.utils import Utils
 except ImportError:
+    from block_detector import BlockDetector, BlockInfo  # type: ignore
     from challenge_resolvers import (  # type: ignore
         ChallengeResolverChain,
         EmailChallengeResolver,
     )
-try:
-    from instat.login_flow import FormLogin, SessionRestorer
-except ImportError:
-    from login_flow import FormLogin, SessionRestorer  # type: ignore
-
-# Setup Loguru logger for advanced logging
-logger.remove()
-logger.add(
-    sys.stderr,
-    level="DEBUG",
-    colorize=True,
-    backtrace=True,
-    diagnose=False,
-    format="<green>{time:YYYY-MM-DD HH:mm:ss.SSS}</green> | <level>{level: <8}</level> | "
-           "<cyan>{name}</cyan>:<cyan>{function}</cyan>:<cyan>{line}</cyan> - <level>{message}</level>"
-)
-logger.add("instat/logs/insta_login.log", rotation="10 MB", retention="10 days", level="DEBUG", backtrace=True, diagnose=False)
-
-# Import our generic utility
-try:
-    from instat.config.selector_loader import SelectorLoader
-    from instat.utils import Utils
-except ImportError:
     from config.selector_loader import SelectorLoader
+    from exceptions import AccountBlockedError
+    from login_flow import FormLogin, SessionRestorer  # type: ignore
     from utils import Utils
 
+
 class MetaInterstitialError(Exception):
     """Raised when a Meta interstitial (e.g., Meta Verified / checkpoint) blocks the login process."""
     def __init__(self, message, *, url, page_title, evidence_path=None, screenshot_path=None):
@@ -74,7 +50,8 @@ class InstaLogin:
 
     def __init__(self, username, password, headless=True, timeout=10,
                  session_cache=None, base_url=None, imap_config=None,
-                 block_detector=None, challenge_chain=None):
+                 block_detector=None, challenge_chain=None,
+                 disable_images=True, page_load_strategy='eager'):
         self.username = username
         self.password = password
         self.timeout = timeout
@@ -87,7 +64,11 @@ class InstaLogin:
         # the login flow.
         self._block_detector = block_detector or BlockDetector()
         logger.info("Initializing InstaLogin instance")
-        self.driver = self.init_driver(headless)
+        self.driver = self.init_driver(
+            headless,
+            disable_images=disable_images,
+            page_load_strategy=page_load_strategy,
+        )
         self.close_keywords = ["not now", "agora não", "salvar", "save", "skip", "not now", "ahora no", "jetzt nicht"]
         self.selectors = SelectorLoader()
         # challenge_chain is swappable: by default the chain contains
@@ -129,9 +110,18 @@ class InstaLogin:
                 return str(exe)
         return None
 
-    def init_driver(self, headless):
+    def init_driver(self, headless, disable_images=True, page_load_strategy='eager'):
+        """Builds the Firefox driver.
+
+        disable_images: block image loading (selectors only read text).
+        page_load_strategy: 'eager' returns from driver.get() on
+          DOMContentLoaded instead of the full `load` event; every caller
+          already waits explicitly for the elements it needs. Pass
+          'normal' to restore Selenium's default.
+        """
         logger.debug("Setting up Firefox options with mobile user agent")
         options = webdriver.FirefoxOptions()
+        options.page_load_strategy = page_load_strategy
         mobile_user_agent = (
             "Mozilla/5.0 (Linux; Android 8.0; Nexus 5 Build/OPR6.170623.013) "
             "AppleWebKit/537.36 (KHTML, like Gecko) Chrome/89.0.4389.72 Mobile Safari/537.36"
@@ -140,9 +130,12 @@ class InstaLogin:
 
         # Performance: skip heavy resources not used by selectors.
         # Reduces per-navigation time by 30-50%.
-        options.set_preference("permissions.default.image", 2)  # block images
+        if disable_images:
+            options.set_preference("permissions.default.image", 2)  # block images
         options.set_preference("dom.ipc.plugins.enabled.libflashplayer.so", False)
         options.set_preference("media.autoplay.default", 5)  # no autoplay
+        options.set_preference("dom.webnotifications.enabled", False)
+        options.set_preference("browser.cache.disk.enable", False)  # memory cache only
         options.set_preference("network.http.pipelining", True)
         options.set_preference("network.http.proxy.pipelining", True)
         options.set_preference("network.http.pipelining.maxrequests", 8)
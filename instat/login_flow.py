@@ -43,13 +43,29 @@ from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.support.ui import WebDriverWait
 
 try:
-    from instat.constants import LOGIN_POST_CLICK_DELAY, human_delay
+    from instat.constants import WAIT_POLL_FREQUENCY
     from instat.utils import Utils
 except ImportError:
-    from constants import LOGIN_POST_CLICK_DELAY, human_delay  # type: ignore
+    from constants import WAIT_POLL_FREQUENCY  # type: ignore
     from utils import Utils  # type: ignore
 
 
+# Case folding for XPath 1.0 translate(): ASCII plus the accented
+# capitals that appear in LOGIN_BUTTON_KEYWORDS-style locales.
+_XPATH_UPPER = "ABCDEFGHIJKLMNOPQRSTUVWXYZÁÀÂÃÉÊÍÓÔÕÚÇÑÄÖÜ"
+_XPATH_LOWER = "abcdefghijklmnopqrstuvwxyzáàâãéêíóôõúçñäöü"
+
+
+def _xpath_literal(value: str) -> str:
+    """Quote `value` as an XPath 1.0 string literal."""
+    if "'" not in value:
+        return f"'{value}'"
+    if '"' not in value:
+        return f'"{value}"'
+    parts = value.split("'")
+    return "concat(" + ", \"'\", ".join(f"'{p}'" for p in parts) + ")"
+
+
 class SessionRestorer:
     """Phase 1: restore session from persisted cookies.
 
@@ -145,7 +161,6 @@ class FormLogin:
 
     USERNAME_INPUT_KEY = "LOGIN_USERNAME_INPUT"
     PASSWORD_INPUT_KEY = "LOGIN_PASSWORD_INPUT"
-    LOGIN_BUTTON_CANDIDATE_KEY = "LOGIN_BUTTON_CANDIDATE"
 
     # Keywords to match the login button's textContent across locales.
     LOGIN_BUTTON_KEYWORDS: List[str] = [
@@ -160,6 +175,22 @@ class FormLogin:
         self._selectors = selector_loader
         self._base_url = base_url
         self._timeout = timeout
+        self._wait = None
+        self._wait_driver = None
+        self._login_btn_xpath = self._build_login_button_xpath(
+            self.LOGIN_BUTTON_KEYWORDS
+        )
+
+    @staticmethod
+    def _build_login_button_xpath(keywords: List[str]) -> str:
+        """XPath matching any button / role=button whose textContent
+        contains one of `keywords` (case-insensitive), so the browser
+        does the keyword filter and find_elements returns only matches."""
+        text = f"translate(normalize-space(.), '{_XPATH_UPPER}', '{_XPATH_LOWER}')"
+        predicate = " or ".join(
+            f"contains({text}, {_xpath_literal(kw.casefold())})" for kw in keywords
+        )
+        return f"//*[self::button or @role='button'][{predicate}]"
 
     @property
     def login_url(self) -> str:
@@ -173,13 +204,21 @@ class FormLogin:
         username_input, password_input = self._wait_for_form_fields(driver)
         self._fill_and_submit(username_input, password_input, username, password)
         # The "Ignorar" bar sometimes appears. Dismiss it if present.
-        Utils.click_ignore_button_if_present(
-            driver, timeout=5, wait_before_click=1,
-        )
+        Utils.click_ignore_button_if_present(driver, timeout=5)
         self._wait_for_redirect_or_fallback_click(driver)
 
     # --------------------------- steps -----------------------------
 
+    def _get_wait(self, driver: Any) -> WebDriverWait:
+        """WebDriverWait reused across the steps of one login; rebuilt
+        only when a different driver is passed in."""
+        if self._wait is None or self._wait_driver is not driver:
+            self._wait = WebDriverWait(
+                driver, self._timeout, poll_frequency=WAIT_POLL_FREQUENCY
+            )
+            self._wait_driver = driver
+        return self._wait
+
     def _open_login_page(self, driver: Any) -> None:
         try:
             logger.info("Navigating to Instagram login page")
@@ -189,7 +228,7 @@ class FormLogin:
             raise Exception("Failed to load Instagram login page.") from e
 
     def _wait_for_form_fields(self, driver: Any):
-        wait = WebDriverWait(driver, self._timeout)
+        wait = self._get_wait(driver)
         try:
             logger.debug("Waiting for username and password fields to be visible")
             username_input = wait.until(
@@ -237,7 +276,7 @@ class FormLogin:
         try:
             logger.debug("Waiting for login result via redirect")
             login_url = self.login_url
-            WebDriverWait(driver, self._timeout).until(
+            self._get_wait(driver).until(
                 lambda d: d.current_url != login_url
             )
             return
@@ -246,26 +285,19 @@ class FormLogin:
             self._fallback_button_click(driver)
 
     def _fallback_button_click(self, driver: Any) -> None:
-        """Find a login-button candidate whose textContent matches
-        one of LOGIN_BUTTON_KEYWORDS, click it, and wait for redirect."""
+        """Find a login button whose textContent matches one of
+        LOGIN_BUTTON_KEYWORDS, click it, and wait for redirect. The
+        keyword match is part of the XPath — one round-trip, no
+        per-button textContent reads."""
         try:
-            candidates = driver.find_elements(
-                By.XPATH,
-                self._selectors.get(self.LOGIN_BUTTON_CANDIDATE_KEY),
-            )
-            logger.debug(f"Found {len(candidates)} login button candidates")
+            candidates = driver.find_elements(By.XPATH, self._login_btn_xpath)
+            logger.debug(f"Found {len(candidates)} login buttons matching keywords")
             for btn in candidates:
                 try:
-                    inner_text = (btn.get_attribute("textContent") or "").strip().casefold()
-                    if not any(kw in inner_text for kw in self.LOGIN_BUTTON_KEYWORDS):
-                        continue
-                    logger.debug(
-                        f"Found login button with matching text: '{inner_text}', "
-                        "clicking it."
-                    )
                     btn.click()
+                    # Redirect + readyState wait replaces the old fixed
+                    # post-click sleep.
                     self._wait_for_post_click_redirect(driver)
-                    human_delay(LOGIN_POST_CLICK_DELAY)
                     return
                 except Exception as e:
                     logger.debug(f"Skipping one candidate button due to error: {e}")
@@ -279,10 +311,11 @@ class FormLogin:
 
     def _wait_for_post_click_redirect(self, driver: Any) -> None:
         login_url = self.login_url
-        WebDriverWait(driver, self._timeout).until(
+        wait = self._get_wait(driver)
+        wait.until(
             lambda d, u=login_url: d.current_url != u
         )
-        WebDriverWait(driver, self._timeout).until(
+        wait.until(
             lambda d: d.execute_script("return document.readyState") == "complete"
         )
 
@@ -57,11 +57,11 @@ from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.support.ui import WebDriverWait
 
 try:
-    from instat.constants import human_delay
+    from instat.constants import WAIT_POLL_FREQUENCY, human_delay
     from instat.exceptions import ProfileNotFoundError
     from instat.utils import Utils
 except ImportError:
-    from constants import human_delay  # type: ignore
+    from constants import WAIT_POLL_FREQUENCY, human_delay  # type: ignore
     from exceptions import ProfileNotFoundError  # type: ignore
     from utils import Utils  # type: ignore
 
@@ -91,6 +91,7 @@ class ModalInteraction:
         # present. Owner (SeleniumEngine) controls the once-per-session
         # flag; this class calls the callable without trying to be clever.
         self._dismiss_save_login = dismiss_save_login
+        self._wait: Optional[WebDriverWait] = None  # see _get_wait
 
     # ----------------------- primary API ----------------------------
 
@@ -117,7 +118,7 @@ class ModalInteraction:
     def click_link(self, link: Any, list_type: str) -> bool:
         """Native click first; fall back to JS click on failure."""
         try:
-            WebDriverWait(self._driver, self._timeout).until(
+            self._get_wait().until(
                 EC.element_to_be_clickable(link)
             )
             link.click()
@@ -139,7 +140,7 @@ class ModalInteraction:
     def wait_dialog(self) -> bool:
         """Wait for the modal dialog to appear; True on success."""
         try:
-            WebDriverWait(self._driver, self._timeout).until(
+            self._get_wait().until(
                 EC.presence_of_element_located(
                     (By.CSS_SELECTOR, DIALOG_CSS)
                 )
@@ -163,7 +164,7 @@ class ModalInteraction:
         """Close the modal via its close button; fall back to ESC."""
         try:
             close_btn = self._driver.find_element(
-                By.XPATH, self._selectors.get(CLOSE_MODAL_BUTTON_KEY)
+                *Utils.locator(self._selectors.get(CLOSE_MODAL_BUTTON_KEY))
             )
             close_btn.click()
         except Exception:
@@ -211,6 +212,14 @@ class ModalInteraction:
 
     # ------------------------ internals -----------------------------
 
+    def _get_wait(self) -> WebDriverWait:
+        """One WebDriverWait per instance (driver/timeout are fixed)."""
+        if self._wait is None:
+            self._wait = WebDriverWait(
+                self._driver, self._timeout, poll_frequency=WAIT_POLL_FREQUENCY
+            )
+        return self._wait
+
     def _find_list_link(
         self, profile_id: str, list_type: str,
         raise_on_missing: bool = True,
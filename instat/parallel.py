@@ -128,6 +128,9 @@ def parallel_extract(
     start = time.perf_counter()
     with ThreadPoolExecutor(max_workers=workers) as ex:
         futures = [ex.submit(_worker, i) for i in range(workers)]
+        # Drena todos: um worker que retorna (threshold próprio,
+        # max_duration, stale rounds) não prova que a união está completa.
+        # Quem decide o stop é coord.ingest via stop_threshold.
         for _ in as_completed(futures):
             pass
     elapsed = time.perf_counter() - start
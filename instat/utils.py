@@ -1,4 +1,7 @@
-from typing import List, Set
+import functools
+import re
+from contextlib import contextmanager
+from typing import Iterator, List, Set, Tuple
 
 from loguru import logger
 from selenium.common.exceptions import NoSuchElementException, StaleElementReferenceException, TimeoutException
@@ -14,12 +17,71 @@ except ImportError:
     from config.selector_loader import SelectorLoader
 
 try:
-    from instat.constants import ELEMENT_RETRY_DELAY, LOADING_SPINNER_WAIT, human_delay
+    from instat.constants import (
+        ELEMENT_RETRY_DELAY,
+        ELEMENTS_RETRY_WAIT,
+        LOADING_SPINNER_WAIT,
+        SAVE_LOGIN_DISMISS_WAIT,
+        SCROLL_MUTATION_TIMEOUT,
+        WAIT_POLL_FREQUENCY,
+        human_delay,
+    )
 except ImportError:
-    from constants import ELEMENT_RETRY_DELAY, LOADING_SPINNER_WAIT, human_delay
+    from constants import (
+        ELEMENT_RETRY_DELAY,
+        ELEMENTS_RETRY_WAIT,
+        LOADING_SPINNER_WAIT,
+        SAVE_LOGIN_DISMISS_WAIT,
+        SCROLL_MUTATION_TIMEOUT,
+        WAIT_POLL_FREQUENCY,
+        human_delay,
+    )
+
+
+class _LazyClassAttr:
+    """Atributo de classe calculado no primeiro acesso e então gravado na
+    própria classe (o descriptor some; acessos seguintes são lookup puro).
+
+    Tira a leitura de selectors.json do import de `instat.utils`: a coleta
+    do pytest importa o módulo dezenas de vezes sem tocar em seletor.
+    patch.object(Utils, 'selectors', ...) continua funcionando."""
+
+    def __init__(self, factory):
+        self._factory = factory
+
+    def __set_name__(self, owner, name):
+        self._name = name
+
+    def __get__(self, obj, owner):
+        value = self._factory()
+        setattr(owner, self._name, value)
+        return value
+
+
+@functools.lru_cache(maxsize=None)
+def _default_selectors() -> SelectorLoader:
+    return SelectorLoader()
+
 
 class Utils:
-    selectors = SelectorLoader()
+    selectors = _LazyClassAttr(_default_selectors)
+    # Resolvidos uma vez (no primeiro uso) do loader real — não de um
+    # `selectors` patchado em teste: os helpers abaixo rodam em loops de
+    # polling e não precisam refazer o lookup a cada volta. Via get():
+    # chave ausente (selectors.json vazio/faltando) levanta KeyError no uso,
+    # que os helpers já tratam, em vez de um AttributeError de "Utils".
+    _IGNORE_BUTTON = _LazyClassAttr(lambda: _default_selectors().get("IGNORE_BUTTON"))
+    _LOADING_SPINNER = _LazyClassAttr(lambda: _default_selectors().get("LOADING_SPINNER"))
+    _SAVE_LOGIN_DIALOG = _LazyClassAttr(lambda: _default_selectors().get("SAVE_LOGIN_INFO_DIALOG"))
+
+    @staticmethod
+    def locator(selector: str) -> Tuple[str, str]:
+        """(By, selector) para um seletor de selectors.json: XPath se começa
+        com '//', senão CSS. Entradas simples (atributo/classe) são CSS —
+        o engine CSS do geckodriver é mais rápido que o avaliador XPath."""
+        if selector.startswith('//'):
+            return By.XPATH, selector
+        return By.CSS_SELECTOR, selector
 
     @staticmethod
     def find_element_with_fallback(driver, selectors_list, by_auto=True, timeout=5):
@@ -30,9 +92,8 @@ class Utils:
         """
         for selector in selectors_list:
             try:
-                by = By.XPATH if selector.startswith('//') else By.CSS_SELECTOR
                 element = WebDriverWait(driver, timeout).until(
-                    EC.presence_of_element_located((by, selector))
+                    EC.presence_of_element_located(Utils.locator(selector))
                 )
                 if element:
                     logger.debug(f"Element found with selector: {selector[:60]}")
@@ -47,25 +108,27 @@ class Utils:
         return None
 
     @staticmethod
-    def click_ignore_button_if_present(driver, timeout=5, wait_before_click=3):
+    def click_ignore_button_if_present(driver, timeout=5, wait_before_click=0):
         """
-        Clicks the 'Ignorar' button if it is present on the page, after waiting for a specified duration.
+        Clicks the 'Ignorar' button if it is present on the page.
 
         :param driver: Selenium WebDriver instance.
         :param timeout: Max time to wait for the button to appear.
-        :param wait_before_click: Seconds to wait before clicking the button if it's found.
+        :param wait_before_click: Optional extra pause before clicking. Default 0:
+            element_to_be_clickable already guarantees the button is visible and enabled.
         :return: True if the button was clicked, False if it was not found or could not be clicked.
 
         """
         try:
             logger.debug("Checking if the 'Ignorar' button is present.")
             ignore_button = WebDriverWait(driver, timeout).until(
-                EC.element_to_be_clickable((By.XPATH, Utils.selectors.get("IGNORE_BUTTON")))
+                EC.element_to_be_clickable((By.XPATH, Utils._IGNORE_BUTTON))
             )
 
             if ignore_button:
-                logger.info(f"'Ignorar' button detected. Waiting for {wait_before_click} seconds before clicking.")
-                human_delay(wait_before_click)  # Waiting before clicking
+                logger.info("'Ignorar' button detected. Clicking.")
+                if wait_before_click:
+                    human_delay(wait_before_click)
 
                 ignore_button.click()
                 logger.info("Successfully clicked the 'Ignorar' button.")
@@ -84,74 +147,180 @@ class Utils:
             logger.exception(f"An error occurred while trying to click the 'Ignorar' button: {e}")
             return False
 
+    @staticmethod
+    @contextmanager
+    def implicit_wait(driver, seconds: float) -> Iterator[None]:
+        """Implicit wait escopado: o geckodriver faz o polling do lado do
+        browser (sem um round-trip HTTP por tentativa). Restaura o valor
+        anterior na saída — drivers de `from_driver` podem ter um implicit
+        wait do chamador — e nada vaza para os WebDriverWaits explícitos."""
+        try:
+            previous = driver.timeouts.implicit_wait
+        except Exception:
+            previous = 0
+        driver.implicitly_wait(seconds)
+        try:
+            yield
+        finally:
+            driver.implicitly_wait(previous)
+
     @staticmethod
     def find_element_safe(driver, by, value, max_retries=3):
-        for attempt in range(max_retries):
-            try:
-                element = driver.find_element(by, value)
-                return element
-            except (StaleElementReferenceException, NoSuchElementException) as e:
-                logger.warning(f"Attempt {attempt + 1}/{max_retries}: Error finding element - {e}")
-                human_delay(ELEMENT_RETRY_DELAY)
-        logger.error("Failed to find element after multiple attempts.")
-        return None
+        """Espera até max_retries * ELEMENT_RETRY_DELAY s pelo elemento.
+        Stale/NoSuchElement são re-tentados a cada WAIT_POLL_FREQUENCY
+        em vez de um sleep fixo por tentativa. None se não aparecer."""
+        try:
+            return WebDriverWait(
+                driver, max_retries * ELEMENT_RETRY_DELAY,
+                poll_frequency=WAIT_POLL_FREQUENCY,
+                ignored_exceptions=(StaleElementReferenceException, NoSuchElementException),
+            ).until(EC.presence_of_element_located((by, value)))
+        except TimeoutException:
+            logger.error(f"Failed to find element: {by}={value[:60]}")
+            return None
+
+    # One querySelectorAll + textContent map in the browser; empty strings
+    # are dropped there so they never cross the wire. textContent, not
+    # innerText: innerText forces a layout pass per node.
+    _BATCH_READ_JS = (
+        "return Array.from(document.querySelectorAll(arguments[0]))"
+        ".map(e => (e.textContent || '').trim()).filter(Boolean)"
+    )
+
+    # Incremental variant of the batch read: each node whose text was
+    # returned stores that text in data-instat-seen, and a node is returned
+    # again only when its current text differs from the stored one. Nodes
+    # still empty (not hydrated yet) stay unmarked and are read on a later
+    # round; nodes a virtualized list recycles for another username are
+    # re-read because their text no longer matches the mark. Inserts and
+    # reorders anywhere in the list are picked up since nothing depends on
+    # position or count. textContent reads stay in the browser (no layout);
+    # only the delta crosses the wire. The marks live in the DOM, so
+    # refresh()/get() reset them for free.
+    _BATCH_READ_INCREMENTAL_JS = """
+        const out = [];
+        for (const n of document.querySelectorAll(arguments[0])) {
+            const t = (n.textContent || '').trim();
+            if (!t || n.dataset.instatSeen === t) continue;
+            n.dataset.instatSeen = t;
+            out.push(t);
+        }
+        return out;
+    """
 
     @staticmethod
-    def batch_read_text(driver, css_selector: str) -> Set[str]:
+    def batch_read_text(driver, css_selector: str, incremental: bool = False) -> Set[str]:
         """Lê texto de todos os elementos que casam o seletor CSS em UMA IPC.
         Retorna set de strings não-vazias. Mais rápido que iterar .text em Python
-        (N IPCs vira 1)."""
+        (N IPCs vira 1).
+
+        incremental=True devolve só os nós ainda não lidos (ou cujo texto
+        mudou) na mesma página: o payload é O(Δ) por round em vez de O(N).
+        O chamador precisa acumular os resultados — cada chamada traz
+        apenas o delta."""
         try:
-            texts = driver.execute_script(
-                "return Array.from(document.querySelectorAll(arguments[0]))"
-                ".map(e => (e.textContent || '').trim())",
-                css_selector
-            )
+            if incremental:
+                texts = driver.execute_script(
+                    Utils._BATCH_READ_INCREMENTAL_JS, css_selector
+                )
+            else:
+                texts = driver.execute_script(Utils._BATCH_READ_JS, css_selector)
             return {t for t in (texts or []) if t}
         except Exception as e:
             logger.debug(f"batch_read_text failed ({e}), falling back to Python loop")
             try:
                 elems = driver.find_elements(By.CSS_SELECTOR, css_selector)
-                return {el.text.strip() for el in elems if el.text.strip()}
+                # textContent is a plain DOM read; .text asks the driver to
+                # compute rendered text (layout) — and was read twice here.
+                return {
+                    t for el in elems
+                    if (t := (el.get_attribute("textContent") or "").strip())
+                }
             except Exception:
                 return set()
 
     @staticmethod
-    def find_elements_safe(driver, by, value, max_retries=3, wait_time=0.3):
-        for attempt in range(max_retries):
-            try:
-                elements = driver.find_elements(by, value)
-                if elements:
-                    return elements
-            except (StaleElementReferenceException, NoSuchElementException) as e:
-                logger.warning(f"Attempt {attempt + 1}/{max_retries}: {e}")
-            human_delay(wait_time)
-        return []
-
-    @staticmethod
-    def dynamic_scroll_element(driver: WebDriver, element, item_selector: str, pause_time: float = 0.5, max_attempts: int = 2):
-        attempts = 0
+    def find_elements_safe(driver, by, value, max_retries=3, wait_time=ELEMENTS_RETRY_WAIT):
+        # 1º find direto (1 round-trip quando já há match). Só se vier
+        # vazio entra o implicit wait: retorna assim que houver >= 1 match,
+        # ou [] ao fim do prazo — mesmo budget do antigo loop.
         try:
-            is_body = element.tag_name.lower() == 'body'
-        except Exception:
-            is_body = False
+            elements = driver.find_elements(by, value)
+            if elements:
+                return elements
+            with Utils.implicit_wait(driver, max_retries * wait_time):
+                return driver.find_elements(by, value)
+        except (StaleElementReferenceException, NoSuchElementException) as e:
+            logger.warning(f"find_elements_safe failed: {e}")
+            return []
+
+    # Rola até o fim do container (ou traz o último item à vista quando o
+    # container é o <body>). Usado direto no fallback síncrono.
+    _SCROLL_TO_END_JS = """
+        const root = arguments[0] || document.body, sel = arguments[1];
+        if (root.tagName === 'BODY') {
+            const items = root.querySelectorAll(sel);
+            if (items.length) items[items.length - 1].scrollIntoView(true);
+        } else {
+            root.scrollTop = root.scrollHeight;
+        }
+    """
+
+    # Rola e espera no browser: um MutationObserver resolve assim que o
+    # número de itens cresce, ou com false ao fim de arguments[2] ms.
+    # Substitui o sleep fixo por tentativa do lado Python.
+    _SCROLL_AND_OBSERVE_JS = """
+        const root = arguments[0] || document.body, sel = arguments[1];
+        const timeoutMs = arguments[2], done = arguments[arguments.length - 1];
+        const before = root.querySelectorAll(sel).length;
+        let finished = false, timer = null;
+        const mo = new MutationObserver(() => {
+            if (root.querySelectorAll(sel).length > before) finish(true);
+        });
+        function finish(grew) {
+            if (finished) return;
+            finished = true;
+            mo.disconnect();
+            clearTimeout(timer);
+            done(grew);
+        }
+        mo.observe(root, {childList: true, subtree: true});
+        timer = setTimeout(() => finish(false), timeoutMs);
+        if (root.tagName === 'BODY') {
+            const items = root.querySelectorAll(sel);
+            if (items.length) items[items.length - 1].scrollIntoView(true);
+        } else {
+            root.scrollTop = root.scrollHeight;
+        }
+    """
 
-        while attempts < max_attempts:
+    @staticmethod
+    def dynamic_scroll_element(driver: WebDriver, element, item_selector: str, pause_time: float = 0.5,
+                               max_attempts: int = 2, timeout: float = SCROLL_MUTATION_TIMEOUT) -> bool:
+        """Rola `element` até `max_attempts` vezes, esperando no browser
+        (até `timeout` s por tentativa) novos `item_selector`. Para na
+        primeira tentativa que não traz nada. Retorna True se a lista cresceu.
+        Sem suporte a script assíncrono, cai no scroll síncrono + pause_time."""
+        timeout_ms = int(timeout * 1000)
+        grew_any = False
+        for _ in range(max_attempts):
             try:
-                items = Utils.find_elements_safe(driver, By.CSS_SELECTOR, item_selector)
-                if items:
-                    if is_body:
-                        driver.execute_script("arguments[0].scrollIntoView(true);", items[-1])
-                    else:
-                        driver.execute_script(
-                            'arguments[0].scrollTop = arguments[0].scrollHeight', element
-                        )
-                human_delay(pause_time)
-                attempts += 1
-
+                grew = driver.execute_async_script(
+                    Utils._SCROLL_AND_OBSERVE_JS, element, item_selector, timeout_ms
+                ) is True
             except Exception as e:
-                logger.exception(f"Error during dynamic scrolling: {e}")
+                logger.debug(f"Async scroll observer failed ({e}), using fixed pause.")
+                try:
+                    driver.execute_script(Utils._SCROLL_TO_END_JS, element, item_selector)
+                except Exception as e2:
+                    logger.exception(f"Error during dynamic scrolling: {e2}")
+                    break
+                human_delay(pause_time)
+                continue
+            if not grew:
                 break
+            grew_any = True
+        return grew_any
 
     @staticmethod
     def wait_for_new_profiles(
@@ -165,8 +334,13 @@ class Utils:
         """
         Scrolls and waits until no new profiles are loaded in the scrollable element.
         Stops early if no new profiles are detected.
+
+        Um snapshot por round: o antigo "snapshot_after_scroll" era relido
+        logo em seguida no topo do loop. issubset já para no primeiro
+        perfil novo.
         """
         logger.debug("Starting wait loop for new profiles based on actual content change.")
+        scrolled = False
 
         while True:
             try:
@@ -174,17 +348,22 @@ class Utils:
                 # Check if spinner exists before waiting (fast sync check).
                 # Avoids burning LOADING_SPINNER_WAIT seconds when no spinner is present.
                 try:
-                    spinner_xpath = Utils.selectors.get("LOADING_SPINNER")
+                    spinner_xpath = Utils._LOADING_SPINNER
                     has_spinner = len(driver.find_elements(By.XPATH, spinner_xpath)) > 0
                     if has_spinner:
-                        WebDriverWait(driver, LOADING_SPINNER_WAIT).until_not(
-                            EC.presence_of_element_located((By.XPATH, spinner_xpath))
+                        # invisibility_* já retorna True quando o spinner
+                        # some do DOM ou fica oculto, sem o find_element a
+                        # cada poll do until_not(presence_*).
+                        WebDriverWait(
+                            driver, LOADING_SPINNER_WAIT,
+                            poll_frequency=WAIT_POLL_FREQUENCY,
+                        ).until(
+                            EC.invisibility_of_element_located((By.XPATH, spinner_xpath))
                         )
-                        logger.debug("Loading spinner has disappeared, page is ready.")
                 except TimeoutException:
                     logger.debug("Timeout waiting for loading spinner to disappear. Proceeding anyway.")
                 except Exception as e:
-                    logger.debug(f"Spinner check failed silently: {e}")
+                    logger.debug("Spinner check failed silently: {}", e)
 
                 current_profiles_snapshot = Utils.batch_read_text(driver, profile_selector)
 
@@ -193,10 +372,11 @@ class Utils:
                     logger.debug("New profiles detected. Exiting wait loop.")
                     return True
 
-                logger.debug("No new profiles detected. Scrolling again and retrying...")
+                if scrolled:
+                    break
 
                 # Perform scrolling as part of the process
-                Utils.dynamic_scroll_element(
+                grew = Utils.dynamic_scroll_element(
                     driver,
                     scrollable_element,
                     item_selector=profile_selector,
@@ -204,19 +384,76 @@ class Utils:
                     max_attempts=additional_scroll_attempts
                 )
 
-                # Small wait before next round
-                human_delay(wait_interval)
-
-                # No update, break out
-                snapshot_after_scroll = Utils.batch_read_text(driver, profile_selector)
-                if snapshot_after_scroll.issubset(existing_profiles):
-                    logger.debug("No new profiles detected after scroll. Breaking loop.")
-                    break
+                # The observer already waited for the DOM to grow; only
+                # pause when it timed out without new items.
+                if not grew:
+                    human_delay(wait_interval)
+                scrolled = True
 
             except StaleElementReferenceException:
                 logger.warning("StaleElementReferenceException encountered during profile extraction. Retrying...")
 
-        logger.debug(f"No profiles found during loop. Performing final scrolling ({additional_scroll_attempts} attempts).")
+        logger.debug("No new profiles found during wait loop.")
+        return False
+
+    # Clica, no próprio browser, o primeiro elemento que casa o seletor
+    # (XPath ou CSS) e cujo textContent contém alguma keyword (já em
+    # minúsculas). true = clicou; false = nenhum match.
+    _CLICK_BY_TEXT_JS = """
+        const sel = arguments[0], isXpath = arguments[1], kws = arguments[2];
+        let nodes = [];
+        if (isXpath) {
+            const snap = document.evaluate(
+                sel, document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+            for (let i = 0; i < snap.snapshotLength; i++) nodes.push(snap.snapshotItem(i));
+        } else {
+            nodes = Array.from(document.querySelectorAll(sel));
+        }
+        for (const n of nodes) {
+            const t = (n.textContent || '').toLowerCase();
+            if (kws.some(k => t.includes(k))) {
+                n.click();
+                return true;
+            }
+        }
+        return false;
+    """
+
+    @staticmethod
+    def _wait_save_login_dialog_gone(driver: WebDriver) -> None:
+        """Uma espera explícita pelo diálogo sumir, no lugar do sleep fixo
+        depois do clique. Timeout não é erro: o clique já aconteceu."""
+        try:
+            WebDriverWait(
+                driver, SAVE_LOGIN_DISMISS_WAIT,
+                poll_frequency=WAIT_POLL_FREQUENCY,
+            ).until(EC.invisibility_of_element_located(
+                Utils.locator(Utils._SAVE_LOGIN_DIALOG)
+            ))
+        except TimeoutException:
+            logger.debug("'Save login info' dialog still visible after dismiss click.")
+        except Exception as e:
+            logger.debug("Dialog wait failed silently: {}", e)
+
+    @staticmethod
+    def _click_first_matching(driver: WebDriver, by: str, selector: str, pattern) -> bool:
+        """Fallback Python da fase 2 quando o JS não roda."""
+        try:
+            buttons = driver.find_elements(by, selector)
+        except Exception:
+            return False
+        for button in buttons:
+            try:
+                if not pattern.search((button.get_attribute("textContent") or "").lower()):
+                    continue
+                try:
+                    button.click()
+                except Exception:
+                    driver.execute_script("arguments[0].click();", button)
+                return True
+            except Exception:
+                continue
+        return False
 
     @staticmethod
     def dismiss_save_login_modal(driver: WebDriver, close_keywords: List[str], timeout: int = 6) -> bool:
@@ -229,19 +466,19 @@ class Utils:
 
         # Fase 1: seletores específicos (primeiros da lista) — clique direto, sem filtro de texto
         for selector in button_selectors[:2]:
-            by = By.XPATH if selector.startswith('//') else By.CSS_SELECTOR
             try:
-                WebDriverWait(driver, timeout).until(
-                    lambda d, s=selector, b=by: len(d.find_elements(b, s)) > 0
+                # presence_of_element_located devolve o próprio elemento —
+                # sem um find_elements extra depois do wait.
+                element = WebDriverWait(driver, timeout).until(
+                    EC.presence_of_element_located(Utils.locator(selector))
                 )
-                elements = driver.find_elements(by, selector)
-                if elements:
+                if element:
                     logger.debug(f"Found targeted dismiss element with selector: {selector[:60]}. Clicking...")
                     try:
-                        elements[0].click()
+                        element.click()
                     except Exception:
-                        driver.execute_script("arguments[0].click();", elements[0])
-                    human_delay(1.0)
+                        driver.execute_script("arguments[0].click();", element)
+                    Utils._wait_save_login_dialog_gone(driver)
                     logger.debug("Modal 'Save login info' dismissed via targeted selector.")
                     return True
             except TimeoutException:
@@ -250,27 +487,30 @@ class Utils:
                 logger.debug(f"Targeted selector failed: {e}")
                 continue
 
-        # Fase 2: seletores genéricos — filtro por keyword no texto
+        # Fase 2: seletores genéricos — busca por keyword e clique num único
+        # execute_script por seletor (sem .text/.click por botão). O regex
+        # pré-compilado cobre o fallback Python se o JS não devolver bool.
+        keywords = [k.lower() for k in close_keywords if k]
+        if not keywords:
+            logger.warning("No close keywords given; skipping generic 'Save login info' selectors.")
+            return False
+        pattern = re.compile("|".join(map(re.escape, keywords)))
         for selector in button_selectors[2:]:
-            by = By.XPATH if selector.startswith('//') else By.CSS_SELECTOR
+            by, _ = Utils.locator(selector)
             try:
-                all_buttons = driver.find_elements(by, selector)
-                for button in all_buttons:
-                    try:
-                        text = button.text.strip().lower()
-                        if any(keyword in text for keyword in close_keywords):
-                            logger.debug(f"Found dismiss button with text: '{text}'. Clicking...")
-                            try:
-                                button.click()
-                            except Exception:
-                                driver.execute_script("arguments[0].click();", button)
-                            human_delay(1.0)
-                            logger.debug("Modal 'Save login info' dismissed via keyword match.")
-                            return True
-                    except Exception:
-                        continue
+                clicked = driver.execute_script(
+                    Utils._CLICK_BY_TEXT_JS, selector, by == By.XPATH, keywords
+                )
             except Exception:
+                clicked = None
+            if clicked is False:
                 continue
+            if clicked is not True:
+                clicked = Utils._click_first_matching(driver, by, selector, pattern)
+            if clicked:
+                logger.debug(f"Dismissed via selector {selector[:60]} (keyword match).")
+                Utils._wait_save_login_dialog_gone(driver)
+                return True
 
         logger.warning("Could not detect or close 'Save login info' modal with any selector.")
         return False
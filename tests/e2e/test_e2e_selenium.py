@@ -25,6 +25,24 @@ def engine(fake_instagram):
         pass
 
 
+@pytest.fixture(scope='module')
+def logged_in_engine(fake_instagram):
+    """Um Firefox + login compartilhados pelos testes de extração do
+    módulo — launch + login dominam o tempo de cada teste. Cada
+    extract() navega para o perfil, então não há estado de página
+    vazando entre testes."""
+    eng = SeleniumEngine(
+        headless=True, timeout=10,
+        base_url=fake_instagram.base_url,
+    )
+    eng.login('testuser', 'testpass')
+    yield eng
+    try:
+        eng.quit()
+    except Exception:
+        pass
+
+
 def test_login_against_fake_server(engine):
     """Login com credenciais válidas do fake server."""
     result = engine.login('testuser', 'testpass')
@@ -32,28 +50,27 @@ def test_login_against_fake_server(engine):
     assert engine._driver is not None
 
 
-def test_extract_followers_against_fake_server(engine):
+def test_extract_followers_against_fake_server(logged_in_engine):
     """Extrai followers do perfil 'target' (100 perfis no STATE)."""
-    engine.login('testuser', 'testpass')
-    followers = engine.extract('target', 'followers', max_duration=30.0)
+    followers = logged_in_engine.extract('target', 'followers', max_duration=30.0)
     assert isinstance(followers, set)
     assert len(followers) >= 10  # pelo menos alguns spans do DOM
     assert any(u.startswith('user_') for u in followers)
 
 
-def test_extract_nonexistent_profile(engine):
+def test_extract_nonexistent_profile(logged_in_engine):
     """Perfil que não existe no STATE → extrai 0 perfis ou levanta ProfileNotFound."""
     from instat.exceptions import ProfileNotFoundError
-    engine.login('testuser', 'testpass')
     try:
-        result = engine.extract('nonexistent', 'followers', max_duration=10.0)
+        result = logged_in_engine.extract('nonexistent', 'followers', max_duration=10.0)
         assert len(result) == 0
     except ProfileNotFoundError:
         pass
 
 
 def test_extract_handles_rate_limit(engine):
-    """Com STATE.mode='ratelimit', requests retornam 429."""
+    """Com STATE.mode='ratelimit', requests retornam 429. Usa browser
+    próprio: o bloqueio não deve contaminar a sessão compartilhada."""
     engine.login('testuser', 'testpass')
     STATE.mode = 'ratelimit'
     try:
@@ -64,10 +81,10 @@ def test_extract_handles_rate_limit(engine):
         pass
 
 
-def test_selectors_work_on_fake_dom(engine):
+def test_selectors_work_on_fake_dom(logged_in_engine):
     """Verifica que FOLLOWERS_LINK do selectors.json casa com o HTML fake."""
     from selenium.webdriver.common.by import By
-    engine.login('testuser', 'testpass')
+    engine = logged_in_engine
     engine._driver.get(f'{engine._base_url}/target/')
     links = engine._driver.find_elements(
         By.XPATH, "//a[contains(@href, '/followers/')]"
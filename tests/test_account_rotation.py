@@ -16,6 +16,8 @@ def _make_extractor_skeleton(**kwargs):
     ext.timeout = 10
     ext._completion_threshold_override = None
     ext._block_predictor = None
+    ext._disable_images = True
+    ext._page_load_strategy = 'eager'
     ext.username = 'primary'
     ext.password = 'pw'
     ext._engine_manager.engines = [
@@ -298,6 +300,8 @@ class TestBuildRotationExtractorInheritance(unittest.TestCase):
         self.assertEqual(kw['timeout'], 42)
         self.assertEqual(kw['proxies'], ['http://proxy'])
         self.assertEqual(kw['engines'], ['selenium', 'httpx'])
+        self.assertTrue(kw['disable_images'])
+        self.assertEqual(kw['page_load_strategy'], 'eager')
         self.assertEqual(kw['imap_config'], {'host': 'x'})
         self.assertEqual(kw['completion_threshold'], 0.5)
 
@@ -31,6 +31,19 @@ class TestSmartBackoff(unittest.TestCase):
         delay = b.wait()
         self.assertLessEqual(delay, 300.0)
 
+    def test_scale_multiplies_delay(self, mock_hd):
+        b = SmartBackoff(base=1.5, max_delay=30.0, jitter=False, scale=2.0)
+        self.assertEqual(b.wait(), 2.0)
+        self.assertEqual(b.wait(), 3.0)
+        b.attempt = 20
+        self.assertEqual(b.wait(), 30.0)
+
+    def test_max_delay_capped_after_jitter(self, mock_hd):
+        b = SmartBackoff(base=1.5, max_delay=30.0, jitter=True, scale=2.0)
+        with patch("instat.backoff.random.uniform", return_value=1.5):
+            b.attempt = 20
+            self.assertEqual(b.wait(), 30.0)
+
     def test_jitter_varies_delay(self, mock_hd):
         """Run wait() 10x at the same attempt level, verify not all delays are identical."""
         delays = []
@@ -1,6 +1,6 @@
 """BlockDetector: pure detection logic, zero driver state mutation."""
 import unittest
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, PropertyMock
 
 from instat.block_detector import BlockDetector, BlockInfo
 
@@ -95,6 +95,35 @@ class TestHTMLDetection(unittest.TestCase):
         self.assertEqual(info.kind, 'url')  # URL wins
 
 
+class TestHTMLProbe(unittest.TestCase):
+    """The signature scan runs in-browser; page_source is the fallback."""
+
+    def _mk_probe_driver(self, probe_result):
+        d = _mk_driver(url="https://www.instagram.com/foo")
+        d.execute_script.return_value = probe_result
+        self.page_source = PropertyMock(return_value="meta verified")
+        type(d).page_source = self.page_source
+        return d
+
+    def test_probe_hit_detected_without_page_source(self):
+        d = self._mk_probe_driver("meta verified")
+        info = BlockDetector().check(d)
+        self.assertEqual(info.kind, 'html')
+        self.assertEqual(info.indicator, 'meta verified')
+        self.page_source.assert_not_called()
+
+    def test_probe_clean_skips_page_source(self):
+        d = self._mk_probe_driver(None)
+        self.assertIsNone(BlockDetector().check(d))
+        self.page_source.assert_not_called()
+
+    def test_probe_failure_falls_back_to_page_source(self):
+        d = self._mk_probe_driver(None)
+        d.execute_script.side_effect = Exception("js disabled")
+        info = BlockDetector().check(d)
+        self.assertEqual(info.kind, 'html')
+
+
 class TestLoginLoopDetection(unittest.TestCase):
 
     def test_stuck_on_login_page(self):
@@ -11,7 +11,9 @@ from instat.constants import (
     LOADING_SPINNER_WAIT,
     LOGIN_POST_CLICK_DELAY,
     PROFILE_WAIT_INTERVAL,
+    SAVE_LOGIN_DISMISS_WAIT,
     SCROLL_INNER_PAUSE,
+    SCROLL_MUTATION_TIMEOUT,
     SCROLL_PAUSE,
     SPINNER_WAIT_TIMEOUT,
     human_delay,
@@ -35,6 +37,8 @@ class TestConstants(unittest.TestCase):
             SPINNER_WAIT_TIMEOUT,
             LOADING_SPINNER_WAIT,
             COOKIE_RESTORE_REFRESH_TIMEOUT,
+            SCROLL_MUTATION_TIMEOUT,
+            SAVE_LOGIN_DISMISS_WAIT,
         ]
         for const in constants:
             self.assertIsInstance(const, (int, float))
@@ -1,3 +1,4 @@
+import os
 import sys
 import time
 import unittest
@@ -10,7 +11,10 @@ from instat.extractor import InstaExtractor
 # Configure Loguru for detailed test logging
 logger.remove()
 logger.add(sys.stderr, level="DEBUG", colorize=True, format="<green>{time}</green> | <level>{message}</level>")
-logger.add("instat/logs/test_insta_extractor.log", rotation="10 MB", retention="10 days", level="DEBUG", diagnose=True)
+# Sob pytest-xdist cada worker importaria este módulo e rotacionaria o
+# mesmo arquivo em paralelo (um .log com timestamp por worker): só stderr.
+if "PYTEST_XDIST_WORKER" not in os.environ:
+    logger.add("instat/logs/test_insta_extractor.log", rotation="10 MB", retention="10 days", level="DEBUG", diagnose=True)
 
 class TestInstaExtractor(unittest.TestCase):
     """
@@ -57,12 +61,28 @@ class TestInstaExtractor(unittest.TestCase):
             ("2.5 mil", 2500),
             ("1 mi", 1000000),
             ("567", 567),
+            (" 42 ", 42),
+            ("1.234.567", 1234567),
+            ("4.1k", 4100),
+            ("1,25m", 1250000),
+            ("2,5\u00a0mil", 2500),
+            ("1\u202f234", 1234),
+            ("1\u2007234", 1234),
+            ("2,5\u3000mil", 2500),
         ]
         for text, expected in test_cases:
             with self.subTest(text=text):
                 result = self.extractor.parse_count_text(text)
                 self.assertEqual(result, expected)
 
+    def test_parse_count_strips_what_the_regex_stripped(self):
+        import re
+        import sys
+
+        from instat.engines.selenium_engine import _STRIP_TABLE
+        spaces = {c for c in range(sys.maxunicode + 1) if re.match(r"\s", chr(c))}
+        self.assertEqual(set(_STRIP_TABLE), spaces)
+
     def test_parse_count_text_invalid_input(self):
         invalid_inputs = ["abc", "123x", "10kk", "", None]
         for input_text in invalid_inputs:
@@ -100,6 +120,53 @@ class TestInstaExtractor(unittest.TestCase):
         self.extractor.pause_time = 0.05
         self.extractor.wait_interval = 0.05
 
+    def test_attempt_budgets_are_separate_and_validated(self):
+        self.extractor.max_reopen_attempts = 2
+        self.assertEqual(self.extractor._engine.max_reopen_attempts, 2)
+        self.assertEqual(self.extractor._engine.max_refresh_attempts, 1)
+        for bad in (-1, 1.5, None, True):
+            with self.subTest(value=bad):
+                with self.assertRaises(ValueError):
+                    self.extractor.max_reopen_attempts = bad
+                with self.assertRaises(ValueError):
+                    self.extractor.max_refresh_attempts = bad
+        self.extractor.max_reopen_attempts = 3
+
+    @patch('instat.engines.engine_manager.EngineManager.extract', return_value=['a'])
+    def test_get_many_reuses_session(self, mock_extract):
+        driver = self.extractor.driver
+        result = self.extractor.get_many(['p1', 'p2'], kind='following')
+        self.assertEqual(result, {'p1': ['a'], 'p2': ['a']})
+        self.assertEqual(mock_extract.call_count, 2)
+        self.assertEqual(mock_extract.call_args[0][1], 'following')
+        self.assertIs(self.extractor.driver, driver)
+
+    def test_get_many_rejects_unknown_kind(self):
+        with self.assertRaises(ValueError):
+            self.extractor.get_many(['p1'], kind='likes')
+
+
+class TestInstaExtractorFromDriver(unittest.TestCase):
+
+    @patch('instat.extractor.InstaLogin')
+    def test_from_driver_skips_login(self, MockLogin):
+        driver = MagicMock()
+        extractor = InstaExtractor.from_driver(driver)
+        MockLogin.assert_not_called()
+        self.assertIs(extractor.driver, driver)
+        self.assertIs(extractor._engine._driver, driver)
+        self.assertIn(id(extractor._engine), extractor._engine_manager._logged_in_engines)
+
+    def test_context_manager_quits(self):
+        driver = MagicMock()
+        with InstaExtractor.from_driver(driver) as extractor:
+            self.assertIs(extractor.driver, driver)
+        driver.quit.assert_called_once()
+
+    def test_from_driver_rejects_accounts(self):
+        with self.assertRaises(ValueError):
+            InstaExtractor.from_driver(MagicMock(), accounts=[{'username': 'u', 'password': 'p'}])
+
 
 if __name__ == '__main__':
     unittest.main(verbosity=2, exit=False)
@@ -76,17 +76,17 @@ class TestModalNotClickable(unittest.TestCase):
             button = MagicMock()
             button.click.side_effect = ElementClickInterceptedException("overlay blocks click")
 
-            # WebDriverWait.until returns truthy; find_elements returns our button
+            # WebDriverWait.until (presence_of_element_located) returns our button
             with patch('instat.utils.WebDriverWait') as MockWait:
-                MockWait.return_value.until.return_value = True
-                driver.find_elements.return_value = [button]
+                MockWait.return_value.until.return_value = button
 
                 result = Utils.dismiss_save_login_modal(
                     driver, close_keywords=['not now'], timeout=1
                 )
 
         self.assertTrue(result, "Should succeed via JS-click fallback")
-        driver.execute_script.assert_called()
+        driver.execute_script.assert_called_once_with("arguments[0].click();", button)
+        driver.find_elements.assert_not_called()
 
     @patch('instat.utils.human_delay', return_value=0)
     def test_all_strategies_fail_returns_false_without_raise(self, _hd):
@@ -106,6 +106,68 @@ class TestModalNotClickable(unittest.TestCase):
 
         self.assertFalse(result)
 
+    @patch('instat.utils.human_delay', return_value=0)
+    def test_generic_phase_clicks_in_browser_then_waits_dialog_gone(self, _hd):
+        """Phase 2: um execute_script acha e clica o botão com keyword —
+        sem find_elements / textContent / click por botão."""
+        from instat.utils import Utils
+
+        with patch.object(Utils, 'selectors', new=self._make_selectors()):
+            driver = MagicMock()
+            driver.execute_script.return_value = True
+            with patch('instat.utils.WebDriverWait') as MockWait, \
+                 patch('instat.utils.EC') as MockEC:
+                MockWait.return_value.until.side_effect = TimeoutException()
+                result = Utils.dismiss_save_login_modal(
+                    driver, close_keywords=['Not Now'], timeout=1
+                )
+
+        self.assertTrue(result)
+        driver.find_elements.assert_not_called()
+        driver.execute_script.assert_called_once()
+        script, selector, is_xpath, kws = driver.execute_script.call_args.args
+        self.assertIs(script, Utils._CLICK_BY_TEXT_JS)
+        self.assertEqual((selector, is_xpath, kws), ("//button", True, ['not now']))
+        MockEC.invisibility_of_element_located.assert_called_once_with(
+            Utils.locator(Utils._SAVE_LOGIN_DIALOG))
+
+    @patch('instat.utils.human_delay', return_value=0)
+    def test_generic_phase_no_match_skips_python_fallback(self, _hd):
+        from instat.utils import Utils
+
+        with patch.object(Utils, 'selectors', new=self._make_selectors()):
+            driver = MagicMock()
+            driver.execute_script.return_value = False
+            with patch('instat.utils.WebDriverWait') as MockWait:
+                MockWait.return_value.until.side_effect = TimeoutException()
+                result = Utils.dismiss_save_login_modal(
+                    driver, close_keywords=['not now'], timeout=1
+                )
+
+        self.assertFalse(result)
+        driver.find_elements.assert_not_called()
+
+    @patch('instat.utils.human_delay', return_value=0)
+    def test_generic_phase_regex_fallback_when_js_unavailable(self, _hd):
+        from instat.utils import Utils
+
+        with patch.object(Utils, 'selectors', new=self._make_selectors()):
+            driver = MagicMock()
+            driver.execute_script.return_value = None
+            other, target = MagicMock(), MagicMock()
+            other.get_attribute.return_value = "Save info"
+            target.get_attribute.return_value = "Agora não"
+            driver.find_elements.return_value = [other, target]
+            with patch('instat.utils.WebDriverWait') as MockWait:
+                MockWait.return_value.until.side_effect = TimeoutException()
+                result = Utils.dismiss_save_login_modal(
+                    driver, close_keywords=['not now', 'agora'], timeout=1
+                )
+
+        self.assertTrue(result)
+        target.click.assert_called_once()
+        other.click.assert_not_called()
+
 
 class TestCheckpointResumeFlow(unittest.TestCase):
     """Simula: extração salva checkpoint, processo morre, 2ª chamada retoma."""
@@ -178,7 +240,6 @@ class TestExpiredSessionFallsBackToForm(unittest.TestCase):
         selmap = {
             "LOGIN_USERNAME_INPUT": "input[name='username']",
             "LOGIN_PASSWORD_INPUT": "input[name='password']",
-            "LOGIN_BUTTON_CANDIDATE": "//button",
         }
         p4 = patch("instat.login.SelectorLoader")
         patches.append(p4)
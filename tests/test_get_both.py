@@ -45,6 +45,8 @@ class TestGetBoth(unittest.TestCase):
         ext.username = 'u'
         ext.password = 'p'
         ext.timeout = 10
+        ext._disable_images = True
+        ext._page_load_strategy = 'eager'
         ext._exporter = None
         ext._engine = MagicMock()
         ext._engine._driver = MagicMock()
@@ -97,6 +99,23 @@ class TestGetBoth(unittest.TestCase):
         self.assertEqual(out['following'], ['seq_g1'])
         self.assertIn('following', call_log)
 
+    def test_cookies_read_before_workers_start(self):
+        """get_cookies roda na thread chamadora, não concorrente com o
+        worker de followers que usa o mesmo driver."""
+        import threading
+        ext = self._make_extractor()
+        caller = threading.get_ident()
+        seen = []
+        ext._engine._driver.get_cookies.side_effect = (
+            lambda: seen.append(threading.get_ident()) or []
+        )
+        ext._engine_manager.extract.return_value = ['f1']
+        with patch('instat.engines.httpx_engine.HttpxEngine') as MockHttpx:
+            MockHttpx.return_value.is_available = True
+            MockHttpx.return_value.extract.return_value = set()
+            ext.get_both('target')
+        self.assertEqual(seen, [caller])
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,50 @@
+import unittest
+from unittest.mock import patch
+
+from instat import _logging
+
+
+class TestConfigureLogging(unittest.TestCase):
+
+    def setUp(self):
+        self._saved = _logging._configured
+
+    def tearDown(self):
+        _logging._configured = self._saved
+
+    def test_second_call_is_noop(self):
+        _logging._configured = True
+        with patch.object(_logging, 'logger') as mock_logger:
+            _logging.configure_logging()
+        mock_logger.remove.assert_not_called()
+        mock_logger.add.assert_not_called()
+
+    def test_file_sink_defaults_to_info(self):
+        _logging._configured = False
+        with patch.object(_logging, 'logger') as mock_logger, \
+             patch.dict('os.environ', {}, clear=True):
+            _logging.configure_logging()
+        mock_logger.remove.assert_called_once()
+        file_call = mock_logger.add.call_args_list[-1]
+        self.assertEqual(file_call.args[0], _logging.LOG_FILE)
+        self.assertEqual(file_call.kwargs['level'], 'INFO')
+
+    def test_env_var_opts_into_debug(self):
+        _logging._configured = False
+        with patch.object(_logging, 'logger') as mock_logger, \
+             patch.dict('os.environ', {'INSTAT_LOG_LEVEL': 'debug'}):
+            _logging.configure_logging()
+        self.assertEqual(mock_logger.add.call_args_list[-1].kwargs['level'], 'DEBUG')
+
+    def test_invalid_env_level_falls_back_to_info(self):
+        _logging._configured = False
+        with patch.object(_logging, 'logger') as mock_logger, \
+             patch.dict('os.environ', {'INSTAT_LOG_LEVEL': 'verbose'}):
+            mock_logger.level.side_effect = ValueError("Level 'VERBOSE' does not exist")
+            _logging.configure_logging()
+        self.assertEqual(mock_logger.add.call_args_list[-1].kwargs['level'], 'INFO')
+        self.assertIn('VERBOSE', mock_logger.warning.call_args.args[0])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -23,30 +23,40 @@ class TestInstaLogin(unittest.TestCase):
         cls.wrong_password = "wrongpass"
         cls.mock_selector_map = {
             "LOGIN_USERNAME_INPUT": "input[name='username']",
-            "LOGIN_PASSWORD_INPUT": "input[name='password']",
-            "LOGIN_BUTTON_CANDIDATE": "//button"
+            "LOGIN_PASSWORD_INPUT": "input[name='password']"
         }
         cls.login_url = "https://www.instagram.com/accounts/login/"
 
+        # Patchers started once for the class (not per test). geckodriver
+        # resolution and Service are patched too, so no test touches the
+        # network or needs a local geckodriver.
+        cls._patchers = [
+            patch("instat.login.webdriver.Firefox"),
+            patch("instat.login.SelectorLoader"),
+            patch("instat.login.GeckoDriverManager"),
+            patch("instat.login.Service"),
+        ]
+        cls.mock_firefox, mock_loader_class, mock_gecko, _ = [p.start() for p in cls._patchers]
+        mock_gecko.return_value.install.return_value = "/fake/geckodriver"
+        mock_loader_instance = MagicMock()
+        mock_loader_instance.get.side_effect = lambda k: cls.mock_selector_map[k]
+        mock_loader_class.return_value = mock_loader_instance
+
+    @classmethod
+    def tearDownClass(cls):
+        for p in reversed(cls._patchers):
+            p.stop()
+
     def setUp(self):
         self.username = self.__class__.username
         self.correct_password = self.__class__.correct_password
         self.mock_selector_map = self.__class__.mock_selector_map
         self.login_url = self.__class__.login_url
 
-        # Patch Firefox WebDriver and SelectorLoader
-        self.driver_patcher = patch("instat.login.webdriver.Firefox")
-        self.mock_driver = self.driver_patcher.start().return_value
+        # Fresh driver mock per test; the patchers themselves are shared.
+        self.mock_driver = MagicMock()
         self.mock_driver.current_url = self.login_url
-
-        selector_loader_patcher = patch("instat.login.SelectorLoader")
-        mock_loader_class = selector_loader_patcher.start()
-        self.addCleanup(selector_loader_patcher.stop)
-        mock_loader_instance = MagicMock()
-        mock_loader_instance.get.side_effect = lambda k: self.mock_selector_map[k]
-        mock_loader_class.return_value = mock_loader_instance
-
-        self.addCleanup(self.driver_patcher.stop)
+        self.mock_firefox.return_value = self.mock_driver
 
         # Create login instance
         self.client = InstaLogin(self.username, self.correct_password, headless=True)
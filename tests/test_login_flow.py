@@ -73,7 +73,6 @@ class TestFormLogin(unittest.TestCase):
         selectors.get.side_effect = lambda key: {
             'LOGIN_USERNAME_INPUT': "input[name='username']",
             'LOGIN_PASSWORD_INPUT': "input[name='password']",
-            'LOGIN_BUTTON_CANDIDATE': "//button",
         }[key]
         fl = FormLogin(
             selector_loader=selectors,
@@ -134,12 +133,10 @@ class TestFormLogin(unittest.TestCase):
     def test_fallback_click_no_matching_button_raises(self):
         fl, _ = self._mk()
         driver = MagicMock()
-        bad_button = MagicMock()
-        bad_button.get_attribute.return_value = "Cancel"
-        driver.find_elements.return_value = [bad_button]
+        # Keyword filter runs inside the XPath: no match -> empty result.
+        driver.find_elements.return_value = []
         with patch('instat.login_flow.WebDriverWait') as wait, \
-             patch('instat.login_flow.Utils'), \
-             patch('instat.login_flow.human_delay'):
+             patch('instat.login_flow.Utils'):
             # First two succeed (form fields), third times out (no redirect)
             wait.return_value.until.side_effect = [
                 MagicMock(), MagicMock(), TimeoutException(),
@@ -157,8 +154,7 @@ class TestFormLogin(unittest.TestCase):
         u_input = MagicMock()
         p_input = MagicMock()
         with patch('instat.login_flow.WebDriverWait') as wait, \
-             patch('instat.login_flow.Utils'), \
-             patch('instat.login_flow.human_delay'):
+             patch('instat.login_flow.Utils'):
             # Sequence: username field, password field, initial-redirect TimeoutException,
             # then post-click-redirect, then readyState check
             wait.return_value.until.side_effect = [
@@ -167,6 +163,14 @@ class TestFormLogin(unittest.TestCase):
             ]
             fl.execute(driver, 'u', 'pw')
         good_button.click.assert_called_once()
+        good_button.get_attribute.assert_not_called()
+
+    def test_login_button_xpath_encodes_keywords(self):
+        fl, _ = self._mk()
+        xpath = fl._login_btn_xpath
+        self.assertTrue(xpath.startswith("//*[self::button or @role='button']"))
+        for kw in FormLogin.LOGIN_BUTTON_KEYWORDS:
+            self.assertIn(f"'{kw}'", xpath)
 
 
 class TestInstaLoginOrchestrator(unittest.TestCase):
@@ -131,6 +131,44 @@ class TestParallelExtract(unittest.TestCase):
         )
         self.assertEqual(set(result), {'u1', 'u2'})
 
+    def test_partial_result_does_not_stop_other_workers(self):
+        from instat.parallel import parallel_extract
+        first_done = threading.Event()
+        seen_stop = []
+
+        def partial_extract(*args, **kwargs):
+            first_done.set()
+            return {f'a{i}' for i in range(10)}
+
+        def slow_extract(*args, **kwargs):
+            # Só continua depois que o worker parcial já retornou.
+            self.assertTrue(first_done.wait(5))
+            threading.Event().wait(0.05)
+            seen_stop.append(kwargs['should_stop']())
+            return {f'b{i}' for i in range(50)}
+
+        engines = iter([partial_extract, slow_extract])
+        lock = threading.Lock()
+
+        def factory():
+            with lock:
+                side_effect = next(engines)
+            e = MagicMock()
+            e.login.return_value = True
+            e.extract.side_effect = side_effect
+            return e
+
+        result = parallel_extract(
+            'target', 'followers',
+            workers=2,
+            default_credentials=('u', 'p'),
+            target_count=100,
+            stop_threshold=0.98,
+            engine_factory=factory,
+        )
+        self.assertEqual(seen_stop, [False])
+        self.assertEqual(len(set(result)), 60)
+
 
 class TestSeleniumShouldStop(unittest.TestCase):
     @patch('instat.engines.selenium_engine.human_delay', return_value=0)
@@ -2,6 +2,8 @@
 import unittest
 from unittest.mock import MagicMock, patch
 
+from instat.exceptions import BlockedError
+
 
 class TestCompletionThreshold(unittest.TestCase):
     """Solução E: cobertura abaixo de threshold levanta BlockedError."""
@@ -171,8 +173,9 @@ class TestReopenModal(unittest.TestCase):
 class TestGetProfilesTriggersReopenOnRateLimit(unittest.TestCase):
     """PERF-03: quando bate rate limit (stale rounds), chama _reopen_modal."""
 
+    @patch('instat.engines.selenium_engine.SmartBackoff.wait', return_value=0.0)
     @patch('instat.engines.selenium_engine.human_delay', return_value=0)
-    def test_reopen_called_on_stale_rounds_threshold(self, _hd):
+    def test_reopen_called_on_stale_rounds_threshold(self, _hd, _wait):
         from instat.engines.selenium_engine import SeleniumEngine
         eng = SeleniumEngine()
         eng._driver = MagicMock()
@@ -218,6 +221,42 @@ class TestGetProfilesTriggersReopenOnRateLimit(unittest.TestCase):
                 pass
             mock_reopen.assert_not_called()
 
+    @patch('instat.engines.selenium_engine.human_delay', return_value=0)
+    def test_reopens_capped_by_max_reopen_attempts_with_backoff(self, _hd):
+        from instat.engines.selenium_engine import SeleniumEngine
+        eng = SeleniumEngine()
+        eng._driver = MagicMock()
+        eng.max_reopen_attempts = 2
+        eng.max_refresh_attempts = 0  # refresh budget must not cap reopens
+        eng.warmup_threshold = 0
+
+        with patch('instat.engines.selenium_engine.Utils.batch_read_text',
+                   return_value={f'u{i}' for i in range(50)}), \
+             patch.object(eng, '_reopen_modal', return_value=True) as mock_reopen, \
+             patch.object(eng._backoff, 'wait', return_value=0.0) as mock_wait:
+            with self.assertRaises(BlockedError):
+                eng._get_profiles(expected_count=100, max_duration=30.0,
+                                  profile_id='p', list_type='followers')
+        self.assertEqual(mock_reopen.call_count, 2)
+        self.assertEqual(mock_wait.call_count, 2)
+
+    @patch('instat.engines.selenium_engine.human_delay', return_value=0)
+    def test_no_reopen_once_max_duration_spent(self, _hd):
+        from instat.engines.selenium_engine import SeleniumEngine
+        eng = SeleniumEngine()
+        eng._driver = MagicMock()
+        eng.warmup_threshold = 0
+
+        with patch('instat.engines.selenium_engine.Utils.batch_read_text',
+                   return_value={f'u{i}' for i in range(50)}), \
+             patch.object(eng, '_is_max_duration_exceeded',
+                          side_effect=[False] * 5 + [True]), \
+             patch.object(eng, '_reopen_modal', return_value=True) as mock_reopen:
+            with self.assertRaises(BlockedError):
+                eng._get_profiles(expected_count=100, max_duration=30.0,
+                                  profile_id='p', list_type='followers')
+        mock_reopen.assert_not_called()
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -1,4 +1,7 @@
 """Testes dos fixes de performance PERF-01."""
+import json
+import shutil
+import subprocess
 import unittest
 from unittest.mock import MagicMock, patch
 
@@ -49,6 +52,72 @@ class TestFix1SpinnerSkipWhenAbsent(unittest.TestCase):
         # find_elements was called at least once (to check spinner presence)
         self.assertTrue(driver.find_elements.called)
 
+    @patch('instat.utils.human_delay', return_value=0)
+    def test_one_snapshot_per_round(self, _hd):
+        """Scroll sem perfis novos: 2 leituras (antes/depois) e retorna False."""
+        from instat.utils import Utils
+        driver = MagicMock()
+        driver.find_elements.return_value = []
+
+        with patch.object(Utils, 'batch_read_text', return_value={'a'}) as mock_read, \
+             patch.object(Utils, 'dynamic_scroll_element', return_value=False) as mock_scroll:
+            result = Utils.wait_for_new_profiles(
+                driver, scrollable_element=MagicMock(),
+                profile_selector='span._ap3a',
+                existing_profiles={'a'},
+                wait_interval=0, additional_scroll_attempts=1,
+            )
+
+        self.assertFalse(result)
+        self.assertEqual(mock_read.call_count, 2)
+        mock_scroll.assert_called_once()
+
+    @patch('instat.utils.human_delay', return_value=0)
+    @patch('instat.utils.EC')
+    @patch('instat.utils.WebDriverWait')
+    def test_present_spinner_waits_for_invisibility(self, MockWait, MockEC, _hd):
+        from instat.constants import LOADING_SPINNER_WAIT, WAIT_POLL_FREQUENCY
+        from instat.utils import Utils
+        driver = MagicMock()
+        driver.find_elements.return_value = [MagicMock()]  # spinner no DOM
+
+        with patch.object(Utils, 'batch_read_text', return_value={'new'}):
+            Utils.wait_for_new_profiles(
+                driver, scrollable_element=MagicMock(),
+                profile_selector='span._ap3a',
+                existing_profiles=set(),
+                wait_interval=0, additional_scroll_attempts=1,
+            )
+
+        MockWait.assert_called_once_with(
+            driver, LOADING_SPINNER_WAIT, poll_frequency=WAIT_POLL_FREQUENCY)
+        MockEC.invisibility_of_element_located.assert_called_once()
+        MockWait.return_value.until.assert_called_once_with(
+            MockEC.invisibility_of_element_located.return_value)
+        MockWait.return_value.until_not.assert_not_called()
+
+    @patch('instat.utils.human_delay', return_value=0)
+    def test_missing_spinner_selector_degrades_gracefully(self, _hd):
+        from instat.config.selector_loader import SelectorLoader
+        from instat.utils import Utils, _LazyClassAttr
+        with patch('builtins.open', side_effect=FileNotFoundError):
+            empty = SelectorLoader('missing.json')
+        lazy = _LazyClassAttr(lambda: empty.get('LOADING_SPINNER'))
+        lazy.__set_name__(Utils, '_LOADING_SPINNER')
+        driver = MagicMock()
+        with patch.object(Utils, '_LOADING_SPINNER', lazy), \
+             patch.object(Utils, 'batch_read_text', return_value={'new'}):
+            with self.assertRaises(KeyError):
+                Utils._LOADING_SPINNER
+            result = Utils.wait_for_new_profiles(
+                driver, scrollable_element=MagicMock(),
+                profile_selector='span._ap3a',
+                existing_profiles=set(),
+                wait_interval=0, additional_scroll_attempts=1,
+            )
+        self.assertTrue(result)
+        driver.find_elements.assert_not_called()
+
 
 class TestFix2FirefoxPreferences(unittest.TestCase):
     """FIX 2: Firefox options desabilitam imagens + outras otimizações."""
@@ -87,6 +156,50 @@ class TestFix2FirefoxPreferences(unittest.TestCase):
         self.assertEqual(pref_dict.get("toolkit.telemetry.enabled"), False)
         self.assertEqual(pref_dict.get("datareporting.healthreport.uploadEnabled"), False)
 
+    @patch('instat.login.Service')
+    @patch('instat.login.GeckoDriverManager')
+    @patch('instat.login.webdriver.Firefox')
+    @patch('instat.login.webdriver.FirefoxOptions')
+    def test_eager_page_load_by_default(self, MockOpts, _ff, _gd, _svc):
+        _gd.return_value.install.return_value = '/fake/gecko'
+        from instat.login import InstaLogin
+        login = InstaLogin.__new__(InstaLogin)
+        login.init_driver(headless=True)
+        self.assertEqual(MockOpts.return_value.page_load_strategy, 'eager')
+
+    @patch('instat.login.Service')
+    @patch('instat.login.GeckoDriverManager')
+    @patch('instat.login.webdriver.Firefox')
+    @patch('instat.login.webdriver.FirefoxOptions')
+    def test_images_can_be_reenabled(self, MockOpts, _ff, _gd, _svc):
+        _gd.return_value.install.return_value = '/fake/gecko'
+        opts_instance = MockOpts.return_value
+        from instat.login import InstaLogin
+        login = InstaLogin.__new__(InstaLogin)
+        login.init_driver(headless=True, disable_images=False, page_load_strategy='normal')
+        names = [call.args[0] for call in opts_instance.set_preference.call_args_list]
+        self.assertNotIn("permissions.default.image", names)
+        self.assertEqual(opts_instance.page_load_strategy, 'normal')
+
+    def test_engine_forwards_driver_options_to_login(self):
+        from instat.engines.selenium_engine import SeleniumEngine
+        login_cls = MagicMock()
+        eng = SeleniumEngine(_login_class=login_cls, disable_images=False,
+                             page_load_strategy='normal')
+        eng.login('u', 'p')
+        kwargs = login_cls.call_args.kwargs
+        self.assertFalse(kwargs['disable_images'])
+        self.assertEqual(kwargs['page_load_strategy'], 'normal')
+
+    def test_extractor_forwards_driver_options_to_engine(self):
+        from instat.extractor import InstaExtractor
+        with patch('instat.extractor.SeleniumEngine') as MockEngine:
+            InstaExtractor('u', 'p', disable_images=False,
+                           page_load_strategy='normal')
+        kwargs = MockEngine.call_args.kwargs
+        self.assertFalse(kwargs['disable_images'])
+        self.assertEqual(kwargs['page_load_strategy'], 'normal')
+
 
 class TestFix3SessionRestoreValidation(unittest.TestCase):
     """FIX 3: _try_restore_session valida sessionid cookie antes de confiar."""
@@ -178,10 +291,13 @@ class TestFix5BatchReadText(unittest.TestCase):
         driver = MagicMock()
         driver.execute_script.side_effect = Exception("JS failed")
         fake_elem = MagicMock()
-        fake_elem.text = 'alice'
-        driver.find_elements.return_value = [fake_elem]
+        fake_elem.get_attribute.return_value = ' alice '
+        blank_elem = MagicMock()
+        blank_elem.get_attribute.return_value = None
+        driver.find_elements.return_value = [fake_elem, blank_elem]
         result = Utils.batch_read_text(driver, 'span')
         self.assertEqual(result, {'alice'})
+        fake_elem.get_attribute.assert_called_once_with('textContent')
 
     def test_batch_read_empty_returns_empty_set(self):
         from instat.utils import Utils
@@ -190,6 +306,26 @@ class TestFix5BatchReadText(unittest.TestCase):
         result = Utils.batch_read_text(driver, 'span')
         self.assertEqual(result, set())
 
+    def test_batch_read_drops_blank_strings_from_driver(self):
+        from instat.utils import Utils
+        driver = MagicMock()
+        driver.execute_script.return_value = ['', 'carol', '']
+        self.assertEqual(Utils.batch_read_text(driver, 'span'), {'carol'})
+
+    @unittest.skipUnless(shutil.which('node'), 'node not installed')
+    def test_batch_read_js_returns_only_non_empty_texts(self):
+        """Roda o script real num DOM fake: vazios/brancos não voltam."""
+        from instat.utils import Utils
+        harness = """
+        const nodes = [' carol ', '', '   ', null, 'dave'].map(t => ({textContent: t}));
+        const document = {querySelectorAll: (q) => (q === 'span' ? nodes : [])};
+        const read = new Function('document', 'arguments', SCRIPT);
+        console.log(JSON.stringify(read(document, ['span'])));
+        """.replace('SCRIPT', json.dumps(Utils._BATCH_READ_JS))
+        out = subprocess.run(['node', '-e', harness], capture_output=True,
+                             text=True, check=True).stdout
+        self.assertEqual(json.loads(out), ['carol', 'dave'])
+
     def test_batch_read_none_returns_empty_set(self):
         from instat.utils import Utils
         driver = MagicMock()
@@ -197,6 +333,140 @@ class TestFix5BatchReadText(unittest.TestCase):
         result = Utils.batch_read_text(driver, 'span')
         self.assertEqual(result, set())
 
+    def test_batch_read_incremental_drops_empty_strings(self):
+        from instat.utils import Utils
+        driver = MagicMock()
+        driver.execute_script.return_value = ['dave', '']
+        result = Utils.batch_read_text(driver, 'span', incremental=True)
+        self.assertEqual(result, {'dave'})
+        self.assertEqual(driver.execute_script.call_args.args[1], 'span')
+
+    @unittest.skipUnless(shutil.which('node'), 'node not installed')
+    def test_incremental_js_rereads_node_hydrated_later(self):
+        """Roda o script real num DOM fake: nó vazio no 1º round é lido
+        quando hidrata; nós inseridos no meio também aparecem; nó reciclado
+        pela lista virtualizada (texto novo) é relido."""
+        from instat.utils import Utils
+        harness = """
+        const nodes = [];
+        const mk = (t) => ({textContent: t, dataset: {}});
+        const document = {querySelectorAll(q) {
+            if (q !== 'span') throw new Error('bad query ' + q);
+            return nodes;
+        }};
+        const read = new Function('document', 'arguments', SCRIPT);
+        const run = () => read(document, ['span']);
+        nodes.push(mk('alice'), mk(''));
+        const rounds = [run()];
+        nodes[1].textContent = 'bob';
+        nodes.splice(0, 0, mk('carol'));
+        rounds.push(run(), run());
+        nodes[1].textContent = 'erin';
+        rounds.push(run());
+        console.log(JSON.stringify(rounds));
+        """.replace('SCRIPT', json.dumps(Utils._BATCH_READ_INCREMENTAL_JS))
+        out = subprocess.run(['node', '-e', harness], capture_output=True,
+                             text=True, check=True).stdout
+        self.assertEqual(json.loads(out),
+                         [['alice'], ['carol', 'bob'], [], ['erin']])
+
+    @patch('instat.engines.selenium_engine.human_delay', return_value=0)
+    def test_get_profiles_reads_incrementally(self, _hd):
+        from instat.engines.selenium_engine import SeleniumEngine
+        eng = SeleniumEngine()
+        eng._driver = MagicMock()
+        with patch('instat.engines.selenium_engine.Utils.batch_read_text',
+                   return_value={'a', 'b'}) as mock_read:
+            eng._get_profiles(expected_count=2, max_duration=5.0)
+        self.assertTrue(mock_read.call_args.kwargs.get('incremental'))
+
+
+class TestScopedImplicitWait(unittest.TestCase):
+    """find_element(s)_safe: polling driver-side via implicit wait escopado."""
+
+    def test_find_elements_safe_hit_is_a_single_round_trip(self):
+        from instat.utils import Utils
+        driver = MagicMock()
+        driver.find_elements.return_value = ['el']
+        with patch('instat.utils.human_delay') as mock_hd:
+            result = Utils.find_elements_safe(driver, 'css selector', 'span', max_retries=3, wait_time=0.5)
+        self.assertEqual(result, ['el'])
+        self.assertEqual(driver.find_elements.call_count, 1)
+        driver.implicitly_wait.assert_not_called()
+        mock_hd.assert_not_called()
+
+    def test_find_elements_safe_miss_waits_driver_side_and_restores(self):
+        from instat.utils import Utils
+        driver = MagicMock()
+        driver.timeouts.implicit_wait = 4
+        driver.find_elements.side_effect = [[], ['el']]
+        result = Utils.find_elements_safe(driver, 'css selector', 'span', max_retries=3, wait_time=0.5)
+        self.assertEqual(result, ['el'])
+        self.assertEqual(
+            [c.args[0] for c in driver.implicitly_wait.call_args_list], [1.5, 4]
+        )
+
+    def test_implicit_wait_restores_on_error(self):
+        from instat.utils import Utils
+        driver = MagicMock()
+        driver.timeouts.implicit_wait = 2
+        with self.assertRaises(RuntimeError):
+            with Utils.implicit_wait(driver, 5):
+                raise RuntimeError('boom')
+        driver.implicitly_wait.assert_called_with(2)
+
+    @patch('instat.utils.WebDriverWait')
+    def test_find_element_safe_polls_ignoring_stale(self, MockWait):
+        from selenium.common.exceptions import StaleElementReferenceException, TimeoutException
+
+        from instat.utils import Utils
+        MockWait.return_value.until.side_effect = TimeoutException()
+        self.assertIsNone(Utils.find_element_safe(MagicMock(), 'xpath', '//x', max_retries=2))
+        args, kwargs = MockWait.call_args
+        self.assertEqual(args[1], 2.0)
+        self.assertEqual(kwargs['poll_frequency'], 0.2)
+        self.assertIn(StaleElementReferenceException, kwargs['ignored_exceptions'])
+
+
+class TestIgnoreButtonNoFixedSleep(unittest.TestCase):
+    """click_ignore_button_if_present clica assim que o botão fica clicável."""
+
+    @patch('instat.utils.human_delay')
+    @patch('instat.utils.WebDriverWait')
+    def test_clicks_without_pre_click_delay(self, MockWait, mock_hd):
+        from instat.utils import Utils
+        button = MagicMock()
+        MockWait.return_value.until.return_value = button
+        self.assertTrue(Utils.click_ignore_button_if_present(MagicMock()))
+        button.click.assert_called_once()
+        mock_hd.assert_not_called()
+
+
+class TestScrollMutationObserver(unittest.TestCase):
+    """dynamic_scroll_element espera no browser em vez de sleep fixo."""
+
+    @patch('instat.utils.human_delay')
+    def test_stops_at_first_round_without_growth(self, mock_hd):
+        from instat.utils import Utils
+        driver = MagicMock()
+        driver.execute_async_script.side_effect = [True, False, True]
+        grew = Utils.dynamic_scroll_element(driver, MagicMock(), 'span', max_attempts=3, timeout=1.5)
+        self.assertTrue(grew)
+        self.assertEqual(driver.execute_async_script.call_count, 2)
+        self.assertEqual(driver.execute_async_script.call_args.args[3], 1500)
+        mock_hd.assert_not_called()
+        driver.find_elements.assert_not_called()
+
+    @patch('instat.utils.human_delay')
+    def test_falls_back_to_sync_scroll_and_pause(self, mock_hd):
+        from instat.utils import Utils
+        driver = MagicMock()
+        driver.execute_async_script.side_effect = Exception('script timeout')
+        grew = Utils.dynamic_scroll_element(driver, MagicMock(), 'span', pause_time=0.3, max_attempts=2)
+        self.assertFalse(grew)
+        self.assertEqual(driver.execute_script.call_count, 2)
+        self.assertEqual(mock_hd.call_count, 2)
+
 
 if __name__ == '__main__':
     unittest.main()
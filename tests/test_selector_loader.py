@@ -7,11 +7,20 @@ from instat.config.selector_loader import SelectorLoader
 
 class TestSelectorLoader(unittest.TestCase):
 
+    # JSON válido parseado uma vez para a classe; os testes só leem o loader.
+    VALID_JSON = json.dumps({
+        "FOLLOW_BUTTON": '//button[@type="button"]',
+        "LOGIN": "input",
+        "CLOSE": ["//button[1]", "//button[2]"],
+    })
+
+    @classmethod
+    def setUpClass(cls):
+        with patch("builtins.open", mock_open(read_data=cls.VALID_JSON)):
+            cls.valid_loader = SelectorLoader("fake_path.json")
+
     def test_load_valid_json(self):
-        mock_data = '{"FOLLOW_BUTTON": "//button[@type=\\"button\\"]"}'
-        with patch("builtins.open", mock_open(read_data=mock_data)):
-            loader = SelectorLoader("fake_path.json")
-            self.assertEqual(loader.get("FOLLOW_BUTTON"), "//button[@type=\"button\"]")
+        self.assertEqual(self.valid_loader.get("FOLLOW_BUTTON"), "//button[@type=\"button\"]")
 
     def test_file_not_found(self):
         with patch("builtins.open", side_effect=FileNotFoundError):
@@ -25,11 +34,82 @@ class TestSelectorLoader(unittest.TestCase):
             self.assertEqual(loader.selectors, {}, "Should fallback to empty config on JSON parse error")
 
     def test_missing_key_raises_keyerror(self):
-        mock_data = '{"LOGIN": "//input[@name=\\"username\\"]"}'
-        with patch("builtins.open", mock_open(read_data=mock_data)):
-            loader = SelectorLoader("dummy_path.json")
-            with self.assertRaises(KeyError):
-                loader.get("NON_EXISTENT")
+        with self.assertRaises(KeyError):
+            self.valid_loader.get("NON_EXISTENT")
+
+    def test_get_returns_first_alternative_for_lists(self):
+        self.assertEqual(self.valid_loader.get("CLOSE"), "//button[1]")
+        self.assertEqual(self.valid_loader.get_all("CLOSE"), ["//button[1]", "//button[2]"])
+
+    def test_empty_list_only_fails_its_own_key(self):
+        data = json.dumps({"EMPTY": [], "LOGIN": "input"})
+        with patch("builtins.open", mock_open(read_data=data)):
+            loader = SelectorLoader("fake_empty.json")
+        self.assertEqual(loader.get("LOGIN"), "input")
+        with self.assertRaises(KeyError):
+            loader.get("EMPTY")
+        with self.assertRaises(AttributeError):
+            loader.ns.EMPTY
+
+    def test_get_and_get_all_read_live_selectors(self):
+        data = json.dumps({"CLOSE": ["//a", "//b"]})
+        with patch("builtins.open", mock_open(read_data=data)):
+            loader = SelectorLoader("fake_live.json")
+        loader.selectors["CLOSE"] = ["//c"]
+        self.assertEqual(loader.get("CLOSE"), "//c")
+        self.assertEqual(loader.ns.CLOSE, "//c")
+        self.assertEqual(loader.get_all("CLOSE"), ["//c"])
+
+    def test_ns_exposes_primary_selectors_as_attributes(self):
+        loader = self.valid_loader
+        self.assertEqual(loader.ns.CLOSE, "//button[1]")
+        self.assertEqual(loader.ns.LOGIN, loader.get("LOGIN"))
+        with self.assertRaises(AttributeError):
+            loader.ns.NON_EXISTENT
+
+    def test_locator_routes_css_and_xpath(self):
+        from selenium.webdriver.common.by import By
+
+        from instat.utils import Utils
+        self.assertEqual(Utils.locator("//button"), (By.XPATH, "//button"))
+        self.assertEqual(Utils.locator("a[href*='/followers/']"),
+                         (By.CSS_SELECTOR, "a[href*='/followers/']"))
+
+    def test_default_link_and_close_selectors_are_css(self):
+        loader = SelectorLoader()
+        for key in ("FOLLOWERS_LINK", "FOLLOWING_LINK", "CLOSE_MODAL_BUTTON"):
+            with self.subTest(key=key):
+                self.assertFalse(loader.get(key).startswith("//"))
+
+    def test_real_file_parsed_once_and_copied(self):
+        import tempfile
+
+        from instat.config import selector_loader
+        with tempfile.TemporaryDirectory() as tmp:
+            path = f"{tmp}/selectors.json"
+            with open(path, "w", encoding="utf-8") as f:
+                json.dump({"CLOSE": ["//a", "//b"]}, f)
+            with patch.object(selector_loader, "_read_json",
+                              wraps=selector_loader._read_json) as mock_read:
+                first = SelectorLoader(path)
+                second = SelectorLoader(path)
+            self.assertEqual(mock_read.call_count, 1)
+            first.get_all("CLOSE").append("//c")
+            self.assertEqual(second.get_all("CLOSE"), ["//a", "//b"])
+
+    def test_import_does_not_read_selectors_json(self):
+        import subprocess
+        import sys
+        code = (
+            "import instat.utils\n"
+            "from instat.config import selector_loader as sl\n"
+            "print(sl._read_json_cached.cache_info().misses)\n"
+            "instat.utils.Utils._LOADING_SPINNER\n"
+            "print(sl._read_json_cached.cache_info().misses)\n"
+        )
+        out = subprocess.run([sys.executable, "-c", code], capture_output=True,
+                             text=True, check=True).stdout.split()
+        self.assertEqual(out, ["0", "1"])
 
 
 if __name__ == "__main__":
@@ -1,3 +1,6 @@
+import json
+import shutil
+import subprocess
 import unittest
 from unittest.mock import MagicMock, patch
 
@@ -58,6 +61,117 @@ class TestSeleniumEngine(unittest.TestCase):
             self.assertIsInstance(result, set)
             self.assertEqual(result, {'a', 'b', 'c'})
 
+    def test_extract_visible_profiles_uses_single_js_read(self):
+        engine = SeleniumEngine()
+        engine._driver = MagicMock()
+        engine._driver.execute_script.return_value = ['a', 'b', '', 'c']
+        seen = {'a'}
+
+        self.assertEqual(engine._extract_visible_profiles(seen), 3)
+        self.assertEqual(seen, {'a', 'b', 'c'})
+        engine._driver.execute_script.assert_called_once()
+        engine._driver.find_elements.assert_not_called()
+
+    def test_selectors_resolved_once_on_first_use(self):
+        engine = SeleniumEngine()
+        engine._selectors = MagicMock()
+        engine._selectors.get.return_value = "span.x"
+        engine._driver = MagicMock()
+        engine._driver.execute_script.return_value = []
+        engine._extract_visible_profiles(set())
+        engine._extract_visible_profiles(set())
+        engine._selectors.get.assert_called_once_with("PROFILE_USERNAME_SPAN")
+        self.assertEqual(engine._sel_profile_span, "span.x")
+
+    def test_missing_selectors_fail_on_use_not_construction(self):
+        from instat.config.selector_loader import SelectorLoader
+        empty = SelectorLoader("/nonexistent/selectors.json")
+        with patch("instat.engines.selenium_engine.SelectorLoader", return_value=empty):
+            engine = SeleniumEngine()
+        with self.assertRaises(KeyError):
+            engine._sel_profile_span
+
+    def test_handle_profile_count_tracks_real_count(self):
+        engine = SeleniumEngine()
+        engine._driver = MagicMock()
+        # 40 -> 90 new profiles: previous_count jumps to the real size.
+        self.assertEqual(engine._handle_profile_count(90, 40, 2, 0), (0, 0, 90))
+        # No growth: only the retry counter moves.
+        self.assertEqual(engine._handle_profile_count(90, 90, 0, 0), (0, 1, 90))
+        engine._driver.refresh.assert_not_called()
+
+    @patch('instat.engines.selenium_engine.WebDriverWait')
+    @patch('instat.engines.selenium_engine.SmartBackoff.wait', return_value=0.0)
+    def test_handle_profile_count_refresh_keeps_baseline(self, _wait, MockWait):
+        engine = SeleniumEngine()
+        engine._driver = MagicMock()
+        tries = engine.max_retry_without_new_profiles
+        result = engine._handle_profile_count(90, 90, tries, 0)
+        self.assertEqual(result, (1, 0, 90))
+        engine._driver.refresh.assert_called_once()
+        # Explicit readiness wait right after the refresh, no fixed sleep.
+        self.assertEqual(MockWait.return_value.until.call_count, 2)
+
+    @patch('instat.engines.selenium_engine.WebDriverWait')
+    @patch('instat.engines.selenium_engine.SmartBackoff.wait', return_value=0.0)
+    def test_handle_profile_count_stops_refreshing_at_budget(self, _wait, _mw):
+        engine = SeleniumEngine()
+        engine._driver = MagicMock()
+        engine.max_refresh_attempts = 1
+        tries = engine.max_retry_without_new_profiles
+        self.assertEqual(engine._handle_profile_count(90, 90, tries, 0), (1, 0, 90))
+        self.assertEqual(engine._handle_profile_count(90, 90, tries, 1),
+                         (1, tries + 1, 90))
+        engine._driver.refresh.assert_called_once()
+
+    def test_get_wait_is_reused_until_driver_changes(self):
+        engine = SeleniumEngine(timeout=7)
+        engine._driver = MagicMock()
+        first = engine._get_wait()
+        self.assertIs(engine._get_wait(), first)
+        self.assertEqual(first._poll, 0.2)
+        engine._driver = MagicMock()
+        self.assertIsNot(engine._get_wait(), first)
+
+    def test_read_link_count_prefers_exact_title(self):
+        engine = SeleniumEngine()
+        engine._driver = MagicMock()
+        engine._driver.execute_script.return_value = "1,234,567"
+        link = MagicMock()
+        link.text = "1.2M followers"
+        self.assertEqual(engine._read_link_count(link), 1234567)
+
+    def test_read_link_count_falls_back_to_text(self):
+        engine = SeleniumEngine()
+        engine._driver = MagicMock()
+        engine._driver.execute_script.return_value = None
+        link = MagicMock()
+        link.text = "1,2 mil seguidores"
+        self.assertEqual(engine._read_link_count(link), 1200)
+
+    @unittest.skipUnless(shutil.which("node"), "node not installed")
+    def test_link_exact_count_js_skips_text_only_aria_label(self):
+        harness = """
+        const el = (attrs, child) => ({
+            getAttribute: (k) => (k in attrs ? attrs[k] : null),
+            querySelector: () => child || null,
+        });
+        const link = el({'aria-label': 'Followers'}, el({title: '1,234,567'}));
+        const run = new Function('arguments', SCRIPT);
+        console.log(JSON.stringify([run([link]), run([el({title: 'Seguidores'})])]));
+        """.replace("SCRIPT", json.dumps(SeleniumEngine._LINK_EXACT_COUNT_JS))
+        out = subprocess.run(["node", "-e", harness], capture_output=True,
+                             text=True, check=True).stdout
+        self.assertEqual(json.loads(out), ["1,234,567", None])
+
+    def test_link_exact_count_takes_first_numeric_token(self):
+        engine = SeleniumEngine()
+        engine._driver = MagicMock()
+        engine._driver.execute_script.return_value = "Followers: 1.234.567"
+        self.assertEqual(engine._link_exact_count(MagicMock()), 1234567)
+        engine._driver.execute_script.return_value = "1.2M followers"
+        self.assertIsNone(engine._link_exact_count(MagicMock()))
+
 
 if __name__ == "__main__":
     unittest.main()
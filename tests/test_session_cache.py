@@ -46,8 +46,7 @@ class TestLoginUsesCache(unittest.TestCase):
     def setUp(self):
         self.mock_selector_map = {
             "LOGIN_USERNAME_INPUT": "input[name='username']",
-            "LOGIN_PASSWORD_INPUT": "input[name='password']",
-            "LOGIN_BUTTON_CANDIDATE": "//button"
+            "LOGIN_PASSWORD_INPUT": "input[name='password']"
         }
 
         self.driver_patcher = patch("instat.login.webdriver.Firefox")